@@ -0,0 +1,764 @@
+"""Optimal Hard-difficulty moves for every reachable Tic-Tac-Toe position.
+
+Generated by ``tools/gen_book.py`` -- do not edit by hand.
+
+``HARD_BOOK`` maps a packed position ``(x_mask << 9) | o_mask`` (bit ``i`` of
+each mask is cell ``i``) to the index of the AI's best move.
+"""
+
+HARD_BOOK = {
+    0x00000: 0, 0x00200: 4, 0x00202: 8, 0x00204: 6, 0x00208: 8, 0x00210: 8,
+    0x00220: 2, 0x00240: 2, 0x00280: 6, 0x00300: 2, 0x00400: 7, 0x00401: 3,
+    0x00404: 5, 0x00408: 4, 0x00410: 6, 0x00420: 4, 0x00440: 8, 0x00480: 0,
+    0x00500: 6, 0x00604: 8, 0x00608: 2, 0x0060c: 4, 0x00610: 2, 0x00614: 6,
+    0x00618: 5, 0x00620: 2, 0x00624: 8, 0x00628: 4, 0x00630: 3, 0x00640: 2,
+    0x00644: 4, 0x00648: 2, 0x00650: 2, 0x00660: 2, 0x00680: 2, 0x00684: 6,
+    0x00688: 2, 0x00690: 2, 0x006a0: 2, 0x006c0: 8, 0x00700: 2, 0x00704: 5,
+    0x00708: 2, 0x00710: 2, 0x00720: 2, 0x00740: 7, 0x00780: 6, 0x00800: 4,
+    0x00801: 8, 0x00802: 6, 0x00808: 0, 0x00810: 6, 0x00820: 6, 0x00840: 0,
+    0x00880: 8, 0x00900: 0, 0x00a02: 4, 0x00a08: 1, 0x00a0a: 4, 0x00a10: 1,
+    0x00a12: 7, 0x00a18: 5, 0x00a20: 1, 0x00a22: 4, 0x00a28: 4, 0x00a30: 3,
+    0x00a40: 1, 0x00a42: 7, 0x00a48: 1, 0x00a50: 1, 0x00a60: 1, 0x00a80: 1,
+    0x00a82: 4, 0x00a88: 1, 0x00a90: 1, 0x00aa0: 1, 0x00ac0: 8, 0x00b00: 1,
+    0x00b02: 7, 0x00b08: 1, 0x00b10: 1, 0x00b20: 1, 0x00b40: 7, 0x00b80: 6,
+    0x00c01: 6, 0x00c08: 0, 0x00c09: 6, 0x00c10: 0, 0x00c11: 8, 0x00c18: 5,
+    0x00c20: 0, 0x00c21: 4, 0x00c28: 4, 0x00c30: 3, 0x00c40: 0, 0x00c41: 3,
+    0x00c48: 0, 0x00c50: 0, 0x00c60: 0, 0x00c80: 0, 0x00c81: 8, 0x00c88: 0,
+    0x00c90: 0, 0x00ca0: 0, 0x00cc0: 8, 0x00d00: 0, 0x00d01: 4, 0x00d08: 0,
+    0x00d10: 0, 0x00d20: 0, 0x00d40: 7, 0x00d80: 6, 0x01000: 5, 0x01001: 1,
+    0x01002: 4, 0x01004: 8, 0x01010: 2, 0x01020: 0, 0x01040: 7, 0x01080: 4,
+    0x01100: 2, 0x01202: 6, 0x01204: 6, 0x01206: 6, 0x01210: 6, 0x01212: 7,
+    0x01214: 6, 0x01220: 6, 0x01222: 6, 0x01224: 8, 0x01230: 6, 0x01240: 8,
+    0x01242: 4, 0x01244: 4, 0x01250: 2, 0x01260: 2, 0x01280: 6, 0x01282: 4,
+    0x01284: 6, 0x01290: 1, 0x012a0: 6, 0x012c0: 8, 0x01300: 6, 0x01302: 6,
+    0x01304: 5, 0x01310: 6, 0x01320: 2, 0x01340: 7, 0x01380: 6, 0x01401: 5,
+    0x01404: 8, 0x01405: 4, 0x01410: 2, 0x01411: 8, 0x01414: 6, 0x01420: 6,
+    0x01421: 8, 0x01424: 8, 0x01430: 8, 0x01440: 8, 0x01441: 4, 0x01444: 4,
+    0x01450: 2, 0x01460: 2, 0x01480: 2, 0x01481: 8, 0x01484: 6, 0x01490: 8,
+    0x014a0: 8, 0x014c0: 8, 0x01500: 2, 0x01501: 4, 0x01504: 5, 0x01510: 0,
+    0x01520: 2, 0x01540: 7, 0x01580: 6, 0x01614: 6, 0x01624: 8, 0x01630: 8,
+    0x01634: 8, 0x01644: 4, 0x01650: 2, 0x01660: 2, 0x01664: 8, 0x01670: 2,
+    0x01684: 6, 0x01690: 8, 0x01694: 6, 0x016a0: 8, 0x016a4: 8, 0x016b0: 8,
+    0x016c0: 8, 0x016c4: 8, 0x016d0: 8, 0x016e0: 8, 0x01704: 5, 0x01710: 2,
+    0x01714: 6, 0x01720: 2, 0x01730: 2, 0x01740: 7, 0x01744: 5, 0x01750: 2,
+    0x01760: 2, 0x01780: 6, 0x01784: 6, 0x01790: 6, 0x017a0: 2, 0x01801: 5,
+    0x01802: 4, 0x01803: 4, 0x01810: 6, 0x01811: 8, 0x01812: 7, 0x01820: 6,
+    0x01821: 8, 0x01822: 6, 0x01830: 6, 0x01840: 5, 0x01841: 8, 0x01842: 7,
+    0x01850: 8, 0x01860: 8, 0x01880: 4, 0x01881: 8, 0x01882: 4, 0x01890: 1,
+    0x018a0: 6, 0x018c0: 8, 0x01900: 6, 0x01901: 4, 0x01902: 4, 0x01910: 0,
+    0x01920: 0, 0x01940: 7, 0x01980: 6, 0x01a12: 7, 0x01a22: 6, 0x01a30: 6,
+    0x01a32: 7, 0x01a42: 7, 0x01a50: 1, 0x01a52: 7, 0x01a60: 1, 0x01a62: 7,
+    0x01a70: 1, 0x01a82: 4, 0x01a90: 1, 0x01aa0: 6, 0x01aa2: 4, 0x01ab0: 1,
+    0x01ac0: 8, 0x01ac2: 8, 0x01ad0: 8, 0x01ae0: 8, 0x01b02: 6, 0x01b10: 6,
+    0x01b12: 7, 0x01b20: 6, 0x01b22: 6, 0x01b30: 6, 0x01b40: 7, 0x01b42: 7,
+    0x01b50: 7, 0x01b60: 7, 0x01b80: 6, 0x01b82: 6, 0x01b90: 6, 0x01ba0: 6,
+    0x01c11: 8, 0x01c21: 7, 0x01c30: 0, 0x01c31: 8, 0x01c41: 8, 0x01c50: 0,
+    0x01c51: 8, 0x01c60: 0, 0x01c61: 8, 0x01c70: 0, 0x01c81: 8, 0x01c90: 0,
+    0x01c91: 8, 0x01ca0: 0, 0x01ca1: 8, 0x01cb0: 0, 0x01cc0: 8, 0x01cc1: 8,
+    0x01cd0: 8, 0x01ce0: 8, 0x01d01: 4, 0x01d10: 0, 0x01d20: 0, 0x01d21: 4,
+    0x01d30: 0, 0x01d40: 7, 0x01d41: 7, 0x01d50: 7, 0x01d60: 7, 0x01d80: 6,
+    0x01d81: 6, 0x01d90: 0, 0x01da0: 6, 0x02000: 0, 0x02001: 1, 0x02002: 6,
+    0x02004: 1, 0x02008: 2, 0x02020: 0, 0x02040: 3, 0x02080: 0, 0x02100: 5,
+    0x02202: 8, 0x02204: 8, 0x02206: 8, 0x02208: 8, 0x0220a: 8, 0x0220c: 8,
+    0x02220: 8, 0x02222: 8, 0x02224: 8, 0x02228: 8, 0x02240: 8, 0x02242: 8,
+    0x02244: 8, 0x02248: 8, 0x02260: 8, 0x02280: 8, 0x02282: 8, 0x02284: 8,
+    0x02288: 8, 0x022a0: 8, 0x022c0: 8, 0x02300: 2, 0x02302: 3, 0x02304: 5,
+    0x02308: 1, 0x02320: 2, 0x02340: 7, 0x02380: 6, 0x02401: 7, 0x02404: 7,
+    0x02405: 7, 0x02408: 7, 0x02409: 6, 0x0240c: 7, 0x02420: 7, 0x02421: 7,
+    0x02424: 8, 0x02428: 7, 0x02440: 7, 0x02441: 3, 0x02444: 7, 0x02448: 0,
+    0x02460: 7, 0x02480: 0, 0x02481: 6, 0x02484: 8, 0x02488: 6, 0x024a0: 8,
+    0x024c0: 8, 0x02500: 7, 0x02501: 7, 0x02504: 5, 0x02508: 7, 0x02520: 2,
+    0x02540: 7, 0x02580: 6, 0x0260c: 6, 0x02624: 8, 0x02628: 8, 0x0262c: 8,
+    0x02644: 7, 0x02648: 2, 0x0264c: 7, 0x02660: 2, 0x02664: 8, 0x02668: 7,
+    0x02684: 8, 0x02688: 8, 0x0268c: 8, 0x026a0: 8, 0x026a4: 8, 0x026a8: 8,
+    0x026c0: 8, 0x026c4: 8, 0x026c8: 8, 0x026e0: 8, 0x02704: 5, 0x02708: 2,
+    0x0270c: 5, 0x02720: 2, 0x02728: 2, 0x02740: 7, 0x02744: 7, 0x02748: 7,
+    0x02760: 2, 0x02780: 6, 0x02784: 6, 0x02788: 6, 0x027a0: 6, 0x02801: 6,
+    0x02802: 6, 0x02803: 6, 0x02808: 6, 0x02809: 6, 0x0280a: 6, 0x02820: 6,
+    0x02821: 6, 0x02822: 6, 0x02828: 6, 0x02840: 0, 0x02841: 3, 0x02842: 5,
+    0x02848: 0, 0x02860: 1, 0x02880: 6, 0x02881: 6, 0x02882: 6, 0x02888: 6,
+    0x028a0: 6, 0x028c0: 8, 0x02900: 6, 0x02901: 6, 0x02902: 6, 0x02908: 6,
+    0x02920: 6, 0x02940: 7, 0x02980: 6, 0x02a0a: 8, 0x02a22: 6, 0x02a28: 6,
+    0x02a2a: 6, 0x02a42: 8, 0x02a48: 5, 0x02a4a: 8, 0x02a60: 8, 0x02a62: 8,
+    0x02a68: 8, 0x02a82: 6, 0x02a88: 8, 0x02a8a: 8, 0x02aa0: 6, 0x02aa2: 6,
+    0x02aa8: 6, 0x02ac0: 8, 0x02ac2: 8, 0x02ac8: 8, 0x02ae0: 8, 0x02b02: 6,
+    0x02b08: 6, 0x02b0a: 6, 0x02b20: 3, 0x02b22: 6, 0x02b28: 6, 0x02b40: 7,
+    0x02b42: 7, 0x02b48: 7, 0x02b60: 7, 0x02b80: 6, 0x02b82: 6, 0x02b88: 6,
+    0x02ba0: 6, 0x02c09: 6, 0x02c21: 8, 0x02c28: 6, 0x02c29: 6, 0x02c41: 3,
+    0x02c48: 0, 0x02c60: 0, 0x02c61: 3, 0x02c68: 0, 0x02c81: 6, 0x02c88: 6,
+    0x02c89: 6, 0x02ca0: 6, 0x02ca1: 6, 0x02ca8: 6, 0x02cc0: 8, 0x02cc1: 8,
+    0x02cc8: 8, 0x02ce0: 8, 0x02d01: 7, 0x02d08: 0, 0x02d09: 6, 0x02d20: 0,
+    0x02d21: 7, 0x02d28: 7, 0x02d40: 7, 0x02d41: 7, 0x02d48: 0, 0x02d60: 7,
+    0x02d80: 6, 0x02d81: 6, 0x02d88: 6, 0x02da0: 6, 0x03001: 5, 0x03002: 5,
+    0x03003: 2, 0x03004: 5, 0x03005: 1, 0x03006: 0, 0x03020: 0, 0x03021: 2,
+    0x03022: 2, 0x03024: 8, 0x03040: 5, 0x03041: 5, 0x03042: 5, 0x03044: 5,
+    0x03060: 8, 0x03080: 5, 0x03081: 5, 0x03082: 5, 0x03084: 5, 0x030a0: 8,
+    0x030c0: 8, 0x03100: 5, 0x03101: 5, 0x03102: 5, 0x03104: 5, 0x03120: 2,
+    0x03140: 7, 0x03180: 6, 0x03206: 6, 0x03222: 8, 0x03224: 8, 0x03226: 8,
+    0x03242: 2, 0x03244: 5, 0x03246: 5, 0x03260: 8, 0x03262: 8, 0x03264: 8,
+    0x03282: 8, 0x03284: 6, 0x03286: 5, 0x032a0: 8, 0x032a2: 8, 0x032a4: 8,
+    0x032c0: 8, 0x032c2: 8, 0x032c4: 8, 0x032e0: 8, 0x03302: 6, 0x03304: 5,
+    0x03306: 5, 0x03320: 2, 0x03322: 2, 0x03340: 7, 0x03342: 7, 0x03344: 5,
+    0x03360: 2, 0x03380: 6, 0x03382: 6, 0x03384: 6, 0x033a0: 2, 0x03405: 8,
+    0x03421: 7, 0x03424: 8, 0x03425: 8, 0x03441: 8, 0x03444: 5, 0x03445: 5,
+    0x03460: 7, 0x03461: 7, 0x03464: 8, 0x03481: 5, 0x03484: 5, 0x03485: 5,
+    0x034a0: 8, 0x034a1: 8, 0x034a4: 8, 0x034c0: 8, 0x034c1: 8, 0x034c4: 8,
+    0x034e0: 8, 0x03501: 5, 0x03504: 5, 0x03505: 5, 0x03520: 2, 0x03521: 2,
+    0x03540: 7, 0x03541: 7, 0x03544: 5, 0x03560: 2, 0x03580: 6, 0x03581: 6,
+    0x03584: 6, 0x035a0: 2, 0x03664: 8, 0x036a4: 8, 0x036c4: 8, 0x036e0: 8,
+    0x036e4: 8, 0x03744: 5, 0x03760: 2, 0x03784: 6, 0x037a0: 2, 0x03803: 8,
+    0x03821: 6, 0x03822: 6, 0x03823: 6, 0x03841: 5, 0x03842: 5, 0x03843: 5,
+    0x03860: 8, 0x03861: 8, 0x03862: 8, 0x03881: 8, 0x03882: 6, 0x03883: 8,
+    0x038a0: 6, 0x038a1: 6, 0x038a2: 6, 0x038c0: 8, 0x038c1: 8, 0x038c2: 8,
+    0x038e0: 8, 0x03901: 5, 0x03902: 0, 0x03903: 5, 0x03920: 6, 0x03921: 6,
+    0x03922: 6, 0x03940: 7, 0x03941: 7, 0x03942: 7, 0x03960: 7, 0x03980: 6,
+    0x03981: 6, 0x03982: 6, 0x039a0: 6, 0x03a62: 8, 0x03aa2: 6, 0x03ac2: 8,
+    0x03ae0: 8, 0x03ae2: 8, 0x03b22: 6, 0x03b42: 7, 0x03b60: 7, 0x03b62: 7,
+    0x03b82: 6, 0x03ba0: 6, 0x03ba2: 6, 0x03c61: 7, 0x03ca1: 6, 0x03cc1: 8,
+    0x03ce0: 8, 0x03ce1: 8, 0x03d21: 7, 0x03d41: 7, 0x03d60: 7, 0x03d61: 7,
+    0x03d81: 6, 0x03da0: 6, 0x03da1: 6, 0x04000: 3, 0x04001: 6, 0x04002: 4,
+    0x04004: 1, 0x04008: 2, 0x04010: 0, 0x04040: 0, 0x04080: 4, 0x04100: 7,
+    0x04202: 4, 0x04204: 3, 0x04206: 4, 0x04208: 8, 0x0420a: 8, 0x0420c: 6,
+    0x04210: 8, 0x04212: 7, 0x04214: 6, 0x04218: 8, 0x04240: 8, 0x04242: 4,
+    0x04244: 4, 0x04248: 2, 0x04250: 2, 0x04280: 4, 0x04282: 4, 0x04284: 6,
+    0x04288: 8, 0x04290: 1, 0x042c0: 8, 0x04300: 3, 0x04302: 7, 0x04304: 6,
+    0x04308: 6, 0x04310: 6, 0x04340: 7, 0x04380: 6, 0x04401: 6, 0x04404: 3,
+    0x04405: 4, 0x04408: 8, 0x04409: 6, 0x0440c: 6, 0x04410: 0, 0x04411: 8,
+    0x04414: 6, 0x04418: 6, 0x04440: 0, 0x04441: 3, 0x04444: 4, 0x04448: 0,
+    0x04450: 2, 0x04480: 0, 0x04481: 8, 0x04484: 6, 0x04488: 6, 0x04490: 6,
+    0x044c0: 8, 0x04500: 6, 0x04501: 4, 0x04504: 4, 0x04508: 0, 0x04510: 0,
+    0x04540: 7, 0x04580: 6, 0x0460c: 7, 0x04614: 6, 0x04618: 2, 0x0461c: 6,
+    0x04644: 4, 0x04648: 2, 0x0464c: 4, 0x04650: 2, 0x04658: 2, 0x04684: 6,
+    0x04688: 2, 0x0468c: 6, 0x04690: 2, 0x04694: 6, 0x04698: 2, 0x046c0: 8,
+    0x046c4: 8, 0x046c8: 8, 0x046d0: 2, 0x04704: 6, 0x04708: 2, 0x0470c: 6,
+    0x04710: 2, 0x04714: 6, 0x04718: 2, 0x04740: 7, 0x04744: 7, 0x04748: 7,
+    0x04750: 7, 0x04780: 6, 0x04784: 6, 0x04788: 6, 0x04790: 6, 0x04801: 8,
+    0x04802: 8, 0x04803: 8, 0x04808: 8, 0x04809: 6, 0x0480a: 8, 0x04810: 8,
+    0x04811: 8, 0x04812: 7, 0x04818: 8, 0x04840: 8, 0x04841: 3, 0x04842: 8,
+    0x04848: 0, 0x04850: 8, 0x04880: 8, 0x04881: 8, 0x04882: 4, 0x04888: 8,
+    0x04890: 1, 0x048c0: 8, 0x04900: 6, 0x04901: 4, 0x04902: 4, 0x04908: 0,
+    0x04910: 0, 0x04940: 7, 0x04980: 6, 0x04a0a: 8, 0x04a12: 7, 0x04a18: 8,
+    0x04a1a: 7, 0x04a42: 8, 0x04a48: 8, 0x04a4a: 8, 0x04a50: 8, 0x04a52: 7,
+    0x04a58: 8, 0x04a82: 4, 0x04a88: 8, 0x04a8a: 4, 0x04a90: 1, 0x04a98: 1,
+    0x04ac0: 8, 0x04ac2: 8, 0x04ac8: 8, 0x04ad0: 8, 0x04b02: 7, 0x04b08: 1,
+    0x04b0a: 7, 0x04b10: 1, 0x04b12: 7, 0x04b18: 1, 0x04b40: 7, 0x04b42: 7,
+    0x04b48: 7, 0x04b50: 7, 0x04b80: 6, 0x04b82: 6, 0x04b88: 6, 0x04b90: 6,
+    0x04c09: 6, 0x04c11: 8, 0x04c18: 6, 0x04c19: 6, 0x04c41: 3, 0x04c48: 0,
+    0x04c50: 0, 0x04c51: 8, 0x04c58: 0, 0x04c81: 8, 0x04c88: 6, 0x04c89: 6,
+    0x04c90: 6, 0x04c91: 8, 0x04c98: 6, 0x04cc0: 8, 0x04cc1: 8, 0x04cc8: 0,
+    0x04cd0: 8, 0x04d01: 4, 0x04d08: 0, 0x04d09: 6, 0x04d10: 0, 0x04d18: 0,
+    0x04d40: 7, 0x04d41: 3, 0x04d48: 0, 0x04d50: 0, 0x04d80: 6, 0x04d81: 6,
+    0x04d88: 6, 0x04d90: 6, 0x05001: 4, 0x05002: 4, 0x05003: 2, 0x05004: 4,
+    0x05005: 1, 0x05006: 0, 0x05010: 0, 0x05011: 8, 0x05012: 7, 0x05014: 6,
+    0x05040: 4, 0x05041: 4, 0x05042: 4, 0x05044: 4, 0x05050: 2, 0x05080: 4,
+    0x05081: 4, 0x05082: 4, 0x05084: 4, 0x05090: 1, 0x050c0: 8, 0x05100: 4,
+    0x05101: 4, 0x05102: 4, 0x05104: 4, 0x05110: 0, 0x05140: 7, 0x05180: 6,
+    0x05206: 6, 0x05212: 7, 0x05214: 6, 0x05216: 6, 0x05242: 4, 0x05244: 4,
+    0x05246: 4, 0x05250: 2, 0x05252: 2, 0x05282: 4, 0x05284: 6, 0x05286: 4,
+    0x05290: 1, 0x05294: 6, 0x052c0: 8, 0x052c2: 8, 0x052c4: 8, 0x052d0: 2,
+    0x05302: 6, 0x05304: 6, 0x05306: 4, 0x05310: 6, 0x05312: 7, 0x05314: 6,
+    0x05340: 7, 0x05342: 7, 0x05344: 7, 0x05350: 2, 0x05380: 6, 0x05382: 6,
+    0x05384: 6, 0x05390: 6, 0x05405: 4, 0x05411: 8, 0x05414: 6, 0x05415: 6,
+    0x05441: 4, 0x05444: 4, 0x05445: 4, 0x05450: 2, 0x05451: 8, 0x05481: 4,
+    0x05484: 4, 0x05485: 4, 0x05490: 6, 0x05491: 8, 0x05494: 6, 0x054c0: 8,
+    0x054c1: 8, 0x054c4: 8, 0x054d0: 2, 0x05501: 4, 0x05504: 4, 0x05505: 4,
+    0x05510: 0, 0x05514: 6, 0x05540: 7, 0x05541: 7, 0x05544: 7, 0x05550: 0,
+    0x05580: 6, 0x05581: 6, 0x05584: 6, 0x05590: 0, 0x05694: 6, 0x056c4: 8,
+    0x056d0: 2, 0x05714: 6, 0x05744: 7, 0x05750: 2, 0x05784: 6, 0x05790: 6,
+    0x05794: 6, 0x05803: 8, 0x05811: 8, 0x05812: 7, 0x05813: 8, 0x05841: 8,
+    0x05842: 8, 0x05843: 4, 0x05850: 8, 0x05851: 8, 0x05852: 7, 0x05881: 8,
+    0x05882: 4, 0x05883: 4, 0x05890: 1, 0x05891: 8, 0x058c0: 8, 0x058c1: 8,
+    0x058c2: 8, 0x058d0: 8, 0x05901: 4, 0x05902: 4, 0x05903: 4, 0x05910: 0,
+    0x05912: 0, 0x05940: 7, 0x05941: 7, 0x05942: 7, 0x05950: 0, 0x05980: 6,
+    0x05981: 6, 0x05982: 6, 0x05990: 0, 0x05a52: 7, 0x05ac2: 8, 0x05ad0: 8,
+    0x05b12: 7, 0x05b42: 7, 0x05b50: 7, 0x05b52: 7, 0x05b82: 6, 0x05b90: 6,
+    0x05c51: 8, 0x05c91: 8, 0x05cc1: 8, 0x05cd0: 8, 0x05cd1: 8, 0x05d41: 7,
+    0x05d50: 0, 0x05d81: 6, 0x05d90: 0, 0x06001: 3, 0x06002: 3, 0x06003: 2,
+    0x06004: 3, 0x06005: 1, 0x06006: 0, 0x06008: 2, 0x06009: 6, 0x0600a: 0,
+    0x0600c: 0, 0x06040: 3, 0x06041: 3, 0x06042: 3, 0x06044: 3, 0x06048: 0,
+    0x06080: 3, 0x06081: 3, 0x06082: 3, 0x06084: 3, 0x06088: 6, 0x060c0: 8,
+    0x06100: 3, 0x06101: 3, 0x06102: 3, 0x06104: 3, 0x06108: 6, 0x06140: 7,
+    0x06180: 6, 0x06206: 6, 0x0620a: 8, 0x0620c: 8, 0x0620e: 8, 0x06242: 2,
+    0x06244: 3, 0x06246: 3, 0x06248: 8, 0x0624a: 8, 0x0624c: 8, 0x06282: 8,
+    0x06284: 6, 0x06286: 6, 0x06288: 8, 0x0628a: 8, 0x0628c: 8, 0x062c0: 8,
+    0x062c2: 8, 0x062c4: 8, 0x062c8: 8, 0x06302: 3, 0x06304: 3, 0x06306: 3,
+    0x06308: 6, 0x0630a: 6, 0x0630c: 6, 0x06340: 7, 0x06342: 7, 0x06344: 7,
+    0x06348: 7, 0x06380: 6, 0x06382: 6, 0x06384: 6, 0x06388: 6, 0x06405: 6,
+    0x06409: 6, 0x0640c: 7, 0x0640d: 6, 0x06441: 3, 0x06444: 3, 0x06445: 3,
+    0x06448: 0, 0x0644c: 0, 0x06481: 3, 0x06484: 3, 0x06485: 3, 0x06488: 6,
+    0x06489: 6, 0x0648c: 6, 0x064c0: 8, 0x064c1: 8, 0x064c4: 8, 0x064c8: 0,
+    0x06501: 3, 0x06504: 6, 0x06505: 3, 0x06508: 7, 0x06509: 6, 0x0650c: 7,
+    0x06540: 7, 0x06541: 3, 0x06544: 7, 0x06548: 0, 0x06580: 6, 0x06581: 6,
+    0x06584: 6, 0x06588: 6, 0x0664c: 7, 0x0668c: 8, 0x066c4: 8, 0x066c8: 8,
+    0x066cc: 8, 0x0670c: 7, 0x06744: 7, 0x06748: 7, 0x0674c: 7, 0x06784: 6,
+    0x06788: 6, 0x0678c: 6, 0x06803: 8, 0x06809: 6, 0x0680a: 6, 0x0680b: 6,
+    0x06841: 3, 0x06842: 8, 0x06843: 3, 0x06848: 0, 0x0684a: 0, 0x06881: 8,
+    0x06882: 6, 0x06883: 3, 0x06888: 6, 0x06889: 6, 0x0688a: 6, 0x068c0: 8,
+    0x068c1: 8, 0x068c2: 8, 0x068c8: 0, 0x06901: 3, 0x06902: 0, 0x06903: 3,
+    0x06908: 6, 0x06909: 6, 0x0690a: 6, 0x06940: 7, 0x06941: 3, 0x06942: 7,
+    0x06948: 0, 0x06980: 6, 0x06981: 6, 0x06982: 6, 0x06988: 6, 0x06a4a: 8,
+    0x06a8a: 8, 0x06ac2: 8, 0x06ac8: 8, 0x06aca: 8, 0x06b0a: 6, 0x06b42: 7,
+    0x06b48: 7, 0x06b4a: 7, 0x06b82: 6, 0x06b88: 6, 0x06b8a: 6, 0x06c89: 6,
+    0x06cc1: 8, 0x06cc8: 0, 0x06d09: 6, 0x06d41: 3, 0x06d48: 0, 0x06d81: 6,
+    0x06d88: 6, 0x06d89: 6, 0x08000: 4, 0x08001: 8, 0x08002: 0, 0x08004: 0,
+    0x08008: 2, 0x08010: 2, 0x08020: 8, 0x08080: 2, 0x08100: 0, 0x08202: 3,
+    0x08204: 3, 0x08206: 3, 0x08208: 4, 0x0820a: 4, 0x0820c: 5, 0x08210: 3,
+    0x08212: 7, 0x08214: 3, 0x08218: 5, 0x08220: 3, 0x08222: 3, 0x08224: 8,
+    0x08228: 4, 0x08230: 3, 0x08280: 3, 0x08282: 4, 0x08284: 3, 0x08288: 4,
+    0x08290: 1, 0x082a0: 3, 0x08300: 3, 0x08302: 3, 0x08304: 5, 0x08308: 5,
+    0x08310: 3, 0x08320: 2, 0x08380: 3, 0x08401: 7, 0x08404: 7, 0x08405: 8,
+    0x08408: 4, 0x08409: 4, 0x0840c: 5, 0x08410: 2, 0x08411: 8, 0x08414: 8,
+    0x08418: 5, 0x08420: 4, 0x08421: 8, 0x08424: 8, 0x08428: 4, 0x08430: 3,
+    0x08480: 2, 0x08481: 8, 0x08484: 8, 0x08488: 2, 0x08490: 2, 0x084a0: 2,
+    0x08500: 2, 0x08501: 4, 0x08504: 5, 0x08508: 4, 0x08510: 0, 0x08520: 2,
+    0x08580: 0, 0x0860c: 5, 0x08614: 3, 0x08618: 5, 0x0861c: 5, 0x08624: 8,
+    0x08628: 4, 0x0862c: 8, 0x08630: 3, 0x08634: 8, 0x08684: 3, 0x08688: 2,
+    0x0868c: 5, 0x08690: 2, 0x08694: 3, 0x08698: 5, 0x086a0: 2, 0x086a4: 8,
+    0x086a8: 4, 0x086b0: 3, 0x08704: 5, 0x08708: 2, 0x0870c: 5, 0x08710: 2,
+    0x08714: 5, 0x08718: 5, 0x08720: 2, 0x08728: 2, 0x08730: 2, 0x08780: 2,
+    0x08784: 5, 0x08788: 2, 0x08790: 2, 0x087a0: 2, 0x08801: 4, 0x08802: 4,
+    0x08803: 4, 0x08808: 4, 0x08809: 4, 0x0880a: 4, 0x08810: 1, 0x08811: 8,
+    0x08812: 7, 0x08818: 5, 0x08820: 4, 0x08821: 4, 0x08822: 4, 0x08828: 4,
+    0x08830: 3, 0x08880: 4, 0x08881: 4, 0x08882: 4, 0x08888: 4, 0x08890: 1,
+    0x088a0: 4, 0x08900: 4, 0x08901: 4, 0x08902: 4, 0x08908: 4, 0x08910: 0,
+    0x08920: 4, 0x08980: 4, 0x08a0a: 4, 0x08a12: 7, 0x08a18: 5, 0x08a1a: 5,
+    0x08a22: 7, 0x08a28: 4, 0x08a2a: 4, 0x08a30: 3, 0x08a32: 7, 0x08a82: 4,
+    0x08a88: 5, 0x08a8a: 4, 0x08a90: 1, 0x08a98: 5, 0x08aa0: 1, 0x08aa2: 4,
+    0x08aa8: 4, 0x08ab0: 1, 0x08b02: 3, 0x08b08: 1, 0x08b0a: 4, 0x08b10: 1,
+    0x08b12: 7, 0x08b18: 5, 0x08b20: 3, 0x08b22: 3, 0x08b28: 4, 0x08b30: 3,
+    0x08b80: 1, 0x08b82: 4, 0x08b88: 1, 0x08b90: 1, 0x08ba0: 1, 0x08c09: 4,
+    0x08c11: 8, 0x08c18: 5, 0x08c19: 5, 0x08c21: 4, 0x08c28: 4, 0x08c29: 4,
+    0x08c30: 3, 0x08c31: 8, 0x08c81: 4, 0x08c88: 5, 0x08c89: 4, 0x08c90: 0,
+    0x08c91: 8, 0x08c98: 5, 0x08ca0: 3, 0x08ca1: 4, 0x08ca8: 4, 0x08cb0: 3,
+    0x08d01: 4, 0x08d08: 0, 0x08d09: 4, 0x08d10: 0, 0x08d18: 0, 0x08d20: 0,
+    0x08d21: 4, 0x08d28: 4, 0x08d30: 0, 0x08d80: 0, 0x08d81: 4, 0x08d88: 0,
+    0x08d90: 0, 0x08da0: 4, 0x09001: 2, 0x09002: 0, 0x09003: 2, 0x09004: 0,
+    0x09005: 1, 0x09006: 0, 0x09010: 0, 0x09011: 8, 0x09012: 7, 0x09014: 0,
+    0x09020: 0, 0x09021: 8, 0x09022: 0, 0x09024: 8, 0x09030: 0, 0x09080: 0,
+    0x09081: 4, 0x09082: 4, 0x09084: 0, 0x09090: 1, 0x090a0: 0, 0x09100: 0,
+    0x09101: 4, 0x09102: 0, 0x09104: 5, 0x09110: 0, 0x09120: 2, 0x09180: 0,
+    0x09405: 8, 0x09411: 8, 0x09414: 0, 0x09415: 8, 0x09421: 8, 0x09424: 8,
+    0x09425: 8, 0x09430: 0, 0x09431: 8, 0x09434: 8, 0x09481: 5, 0x09484: 0,
+    0x09485: 8, 0x09490: 0, 0x09491: 8, 0x09494: 0, 0x094a0: 0, 0x094a1: 8,
+    0x094a4: 8, 0x094b0: 0, 0x09501: 4, 0x09504: 5, 0x09505: 5, 0x09510: 0,
+    0x09514: 5, 0x09520: 2, 0x09521: 2, 0x09530: 0, 0x09580: 0, 0x09581: 4,
+    0x09584: 5, 0x09590: 0, 0x095a0: 2, 0x09803: 4, 0x09811: 8, 0x09812: 7,
+    0x09813: 7, 0x09821: 4, 0x09822: 7, 0x09823: 4, 0x09830: 0, 0x09831: 8,
+    0x09832: 7, 0x09881: 4, 0x09882: 4, 0x09883: 4, 0x09890: 1, 0x09891: 8,
+    0x098a0: 1, 0x098a1: 4, 0x098a2: 4, 0x098b0: 1, 0x09901: 4, 0x09902: 0,
+    0x09903: 4, 0x09910: 0, 0x09912: 0, 0x09920: 0, 0x09921: 4, 0x09922: 0,
+    0x09930: 0, 0x09980: 0, 0x09981: 4, 0x09982: 4, 0x09990: 0, 0x099a0: 4,
+    0x09c31: 8, 0x09c91: 8, 0x09ca1: 4, 0x09cb0: 0, 0x09cb1: 8, 0x09d21: 4,
+    0x09d30: 0, 0x09d81: 4, 0x09d90: 0, 0x09da0: 0, 0x09da1: 4, 0x09db0: 0,
+    0x0a001: 2, 0x0a002: 2, 0x0a003: 2, 0x0a004: 0, 0x0a005: 1, 0x0a006: 0,
+    0x0a008: 2, 0x0a009: 2, 0x0a00a: 2, 0x0a00c: 7, 0x0a020: 2, 0x0a021: 2,
+    0x0a022: 2, 0x0a024: 8, 0x0a028: 2, 0x0a080: 2, 0x0a081: 2, 0x0a082: 2,
+    0x0a084: 3, 0x0a088: 2, 0x0a0a0: 2, 0x0a100: 2, 0x0a101: 2, 0x0a102: 2,
+    0x0a104: 5, 0x0a108: 2, 0x0a120: 2, 0x0a180: 2, 0x0a206: 7, 0x0a20a: 8,
+    0x0a20c: 8, 0x0a20e: 8, 0x0a222: 8, 0x0a224: 8, 0x0a226: 8, 0x0a228: 2,
+    0x0a22a: 8, 0x0a22c: 8, 0x0a282: 2, 0x0a284: 8, 0x0a286: 8, 0x0a288: 2,
+    0x0a28a: 2, 0x0a28c: 8, 0x0a2a0: 2, 0x0a2a2: 2, 0x0a2a4: 8, 0x0a2a8: 2,
+    0x0a302: 2, 0x0a304: 5, 0x0a306: 5, 0x0a308: 2, 0x0a30a: 2, 0x0a30c: 5,
+    0x0a320: 2, 0x0a322: 2, 0x0a328: 2, 0x0a380: 1, 0x0a382: 2, 0x0a384: 5,
+    0x0a388: 2, 0x0a3a0: 2, 0x0a405: 7, 0x0a409: 8, 0x0a40c: 7, 0x0a40d: 7,
+    0x0a421: 8, 0x0a424: 8, 0x0a425: 8, 0x0a428: 2, 0x0a429: 8, 0x0a42c: 8,
+    0x0a481: 2, 0x0a484: 8, 0x0a485: 8, 0x0a488: 2, 0x0a489: 2, 0x0a48c: 8,
+    0x0a4a0: 2, 0x0a4a1: 2, 0x0a4a4: 8, 0x0a4a8: 2, 0x0a501: 7, 0x0a504: 5,
+    0x0a505: 5, 0x0a508: 0, 0x0a509: 7, 0x0a50c: 5, 0x0a520: 2, 0x0a521: 2,
+    0x0a528: 2, 0x0a580: 2, 0x0a581: 2, 0x0a584: 5, 0x0a588: 2, 0x0a5a0: 2,
+    0x0a62c: 8, 0x0a68c: 8, 0x0a6a4: 8, 0x0a6a8: 2, 0x0a6ac: 8, 0x0a70c: 5,
+    0x0a728: 2, 0x0a784: 5, 0x0a788: 2, 0x0a78c: 5, 0x0a7a0: 2, 0x0a7a8: 2,
+    0x0b003: 2, 0x0b005: 1, 0x0b006: 0, 0x0b021: 2, 0x0b022: 2, 0x0b023: 2,
+    0x0b024: 8, 0x0b025: 8, 0x0b026: 8, 0x0b081: 8, 0x0b082: 2, 0x0b083: 2,
+    0x0b084: 0, 0x0b085: 1, 0x0b086: 0, 0x0b0a0: 2, 0x0b0a1: 2, 0x0b0a2: 2,
+    0x0b0a4: 8, 0x0b101: 5, 0x0b102: 0, 0x0b103: 2, 0x0b104: 5, 0x0b105: 5,
+    0x0b106: 0, 0x0b120: 2, 0x0b121: 2, 0x0b122: 2, 0x0b180: 0, 0x0b181: 5,
+    0x0b182: 5, 0x0b184: 5, 0x0b1a0: 2, 0x0b425: 8, 0x0b485: 5, 0x0b4a1: 2,
+    0x0b4a4: 8, 0x0b4a5: 8, 0x0b505: 5, 0x0b521: 2, 0x0b581: 5, 0x0b584: 5,
+    0x0b585: 5, 0x0b5a0: 2, 0x0b5a1: 2, 0x0c001: 2, 0x0c002: 4, 0x0c003: 2,
+    0x0c004: 3, 0x0c005: 1, 0x0c006: 0, 0x0c008: 2, 0x0c009: 8, 0x0c00a: 2,
+    0x0c00c: 0, 0x0c010: 2, 0x0c011: 8, 0x0c012: 7, 0x0c014: 0, 0x0c018: 2,
+    0x0c080: 4, 0x0c081: 4, 0x0c082: 4, 0x0c084: 1, 0x0c088: 2, 0x0c090: 1,
+    0x0c100: 3, 0x0c101: 4, 0x0c102: 0, 0x0c104: 0, 0x0c108: 0, 0x0c110: 0,
+    0x0c180: 4, 0x0c206: 3, 0x0c20a: 8, 0x0c20c: 7, 0x0c20e: 7, 0x0c212: 7,
+    0x0c214: 3, 0x0c216: 7, 0x0c218: 2, 0x0c21a: 7, 0x0c21c: 7, 0x0c282: 4,
+    0x0c284: 3, 0x0c286: 4, 0x0c288: 2, 0x0c28a: 4, 0x0c28c: 4, 0x0c290: 1,
+    0x0c294: 1, 0x0c298: 1, 0x0c302: 3, 0x0c304: 3, 0x0c306: 3, 0x0c308: 1,
+    0x0c30a: 4, 0x0c30c: 1, 0x0c310: 3, 0x0c312: 7, 0x0c314: 3, 0x0c318: 1,
+    0x0c380: 3, 0x0c382: 4, 0x0c384: 3, 0x0c388: 1, 0x0c390: 1, 0x0c405: 7,
+    0x0c409: 8, 0x0c40c: 7, 0x0c40d: 7, 0x0c411: 8, 0x0c414: 3, 0x0c415: 8,
+    0x0c418: 2, 0x0c419: 8, 0x0c41c: 7, 0x0c481: 4, 0x0c484: 3, 0x0c485: 8,
+    0x0c488: 2, 0x0c489: 8, 0x0c48c: 0, 0x0c490: 2, 0x0c491: 8, 0x0c494: 3,
+    0x0c498: 2, 0x0c501: 4, 0x0c504: 3, 0x0c505: 4, 0x0c508: 4, 0x0c509: 4,
+    0x0c50c: 0, 0x0c510: 0, 0x0c514: 0, 0x0c518: 0, 0x0c580: 0, 0x0c581: 4,
+    0x0c584: 3, 0x0c588: 0, 0x0c590: 0, 0x0c61c: 7, 0x0c68c: 8, 0x0c694: 3,
+    0x0c698: 2, 0x0c69c: 8, 0x0c70c: 7, 0x0c714: 3, 0x0c718: 2, 0x0c71c: 7,
+    0x0c784: 3, 0x0c788: 2, 0x0c78c: 4, 0x0c790: 3, 0x0c794: 3, 0x0c798: 2,
+    0x0c803: 8, 0x0c809: 8, 0x0c80a: 7, 0x0c80b: 4, 0x0c811: 8, 0x0c812: 7,
+    0x0c813: 8, 0x0c818: 8, 0x0c819: 8, 0x0c81a: 7, 0x0c881: 8, 0x0c882: 4,
+    0x0c883: 4, 0x0c888: 1, 0x0c889: 8, 0x0c88a: 4, 0x0c890: 1, 0x0c891: 8,
+    0x0c898: 1, 0x0c901: 4, 0x0c902: 4, 0x0c903: 4, 0x0c908: 4, 0x0c909: 4,
+    0x0c90a: 4, 0x0c910: 0, 0x0c912: 0, 0x0c918: 0, 0x0c980: 4, 0x0c981: 4,
+    0x0c982: 4, 0x0c988: 4, 0x0c990: 1, 0x0ca1a: 7, 0x0ca8a: 4, 0x0ca98: 1,
+    0x0cb0a: 4, 0x0cb12: 7, 0x0cb18: 1, 0x0cb1a: 7, 0x0cb82: 4, 0x0cb88: 1,
+    0x0cb8a: 4, 0x0cb90: 1, 0x0cb98: 1, 0x0cc19: 8, 0x0cc89: 8, 0x0cc91: 8,
+    0x0cc98: 0, 0x0cc99: 8, 0x0cd09: 4, 0x0cd18: 0, 0x0cd81: 4, 0x0cd88: 0,
+    0x0cd89: 4, 0x0cd90: 0, 0x0cd98: 0, 0x0d003: 2, 0x0d005: 1, 0x0d006: 0,
+    0x0d011: 8, 0x0d012: 7, 0x0d013: 8, 0x0d014: 0, 0x0d015: 8, 0x0d016: 0,
+    0x0d081: 4, 0x0d082: 4, 0x0d083: 2, 0x0d084: 0, 0x0d085: 1, 0x0d086: 0,
+    0x0d090: 1, 0x0d091: 8, 0x0d094: 1, 0x0d101: 4, 0x0d102: 0, 0x0d103: 2,
+    0x0d104: 0, 0x0d105: 1, 0x0d106: 0, 0x0d110: 0, 0x0d112: 0, 0x0d114: 0,
+    0x0d180: 0, 0x0d181: 4, 0x0d182: 4, 0x0d184: 4, 0x0d190: 0, 0x0d415: 8,
+    0x0d485: 4, 0x0d491: 8, 0x0d494: 0, 0x0d495: 8, 0x0d505: 4, 0x0d514: 0,
+    0x0d581: 4, 0x0d584: 0, 0x0d585: 4, 0x0d590: 0, 0x0d594: 0, 0x0d813: 8,
+    0x0d883: 4, 0x0d891: 8, 0x0d903: 4, 0x0d912: 0, 0x0d981: 4, 0x0d982: 4,
+    0x0d983: 4, 0x0d990: 0, 0x0e003: 2, 0x0e005: 1, 0x0e006: 0, 0x0e009: 2,
+    0x0e00a: 2, 0x0e00b: 2, 0x0e00c: 0, 0x0e00d: 1, 0x0e00e: 0, 0x0e081: 8,
+    0x0e082: 2, 0x0e083: 2, 0x0e084: 3, 0x0e085: 1, 0x0e086: 0, 0x0e088: 2,
+    0x0e089: 2, 0x0e08a: 2, 0x0e08c: 0, 0x0e101: 3, 0x0e102: 0, 0x0e103: 2,
+    0x0e104: 3, 0x0e105: 1, 0x0e106: 0, 0x0e108: 2, 0x0e109: 2, 0x0e10a: 2,
+    0x0e10c: 0, 0x0e180: 0, 0x0e181: 3, 0x0e182: 0, 0x0e184: 3, 0x0e188: 2,
+    0x0e20e: 8, 0x0e286: 3, 0x0e28a: 2, 0x0e28c: 8, 0x0e28e: 8, 0x0e306: 3,
+    0x0e30a: 2, 0x0e30c: 1, 0x0e30e: 7, 0x0e382: 3, 0x0e384: 3, 0x0e386: 3,
+    0x0e388: 2, 0x0e38a: 2, 0x0e38c: 1, 0x0e40d: 7, 0x0e485: 3, 0x0e489: 2,
+    0x0e48c: 0, 0x0e48d: 8, 0x0e505: 3, 0x0e509: 7, 0x0e50c: 7, 0x0e50d: 7,
+    0x0e581: 3, 0x0e584: 3, 0x0e585: 3, 0x0e588: 2, 0x0e589: 2, 0x0e58c: 0,
+    0x10000: 1, 0x10001: 2, 0x10002: 6, 0x10004: 0, 0x10008: 4, 0x10010: 0,
+    0x10020: 4, 0x10040: 3, 0x10100: 5, 0x10202: 8, 0x10204: 8, 0x10206: 6,
+    0x10208: 4, 0x1020a: 8, 0x1020c: 4, 0x10210: 8, 0x10212: 8, 0x10214: 6,
+    0x10218: 5, 0x10220: 4, 0x10222: 8, 0x10224: 8, 0x10228: 4, 0x10230: 3,
+    0x10240: 1, 0x10242: 2, 0x10244: 4, 0x10248: 4, 0x10250: 2, 0x10260: 2,
+    0x10300: 1, 0x10302: 2, 0x10304: 5, 0x10308: 5, 0x10310: 2, 0x10320: 2,
+    0x10340: 2, 0x10401: 4, 0x10404: 4, 0x10405: 4, 0x10408: 4, 0x10409: 6,
+    0x1040c: 4, 0x10410: 0, 0x10411: 8, 0x10414: 6, 0x10418: 5, 0x10420: 4,
+    0x10421: 4, 0x10424: 8, 0x10428: 4, 0x10430: 3, 0x10440: 4, 0x10441: 3,
+    0x10444: 4, 0x10448: 0, 0x10450: 2, 0x10460: 4, 0x10500: 4, 0x10501: 4,
+    0x10504: 5, 0x10508: 4, 0x10510: 0, 0x10520: 2, 0x10540: 4, 0x1060c: 4,
+    0x10614: 6, 0x10618: 5, 0x1061c: 6, 0x10624: 8, 0x10628: 4, 0x1062c: 8,
+    0x10630: 3, 0x10634: 6, 0x10644: 4, 0x10648: 2, 0x1064c: 4, 0x10650: 2,
+    0x10658: 2, 0x10660: 2, 0x10664: 8, 0x10668: 4, 0x10670: 2, 0x10704: 5,
+    0x10708: 2, 0x1070c: 5, 0x10710: 2, 0x10714: 6, 0x10718: 5, 0x10720: 2,
+    0x10728: 2, 0x10730: 2, 0x10740: 2, 0x10744: 5, 0x10748: 4, 0x10750: 2,
+    0x10760: 2, 0x10801: 6, 0x10802: 6, 0x10803: 8, 0x10808: 4, 0x10809: 6,
+    0x1080a: 6, 0x10810: 6, 0x10811: 8, 0x10812: 6, 0x10818: 5, 0x10820: 4,
+    0x10821: 4, 0x10822: 6, 0x10828: 4, 0x10830: 3, 0x10840: 1, 0x10841: 3,
+    0x10842: 0, 0x10848: 0, 0x10850: 0, 0x10860: 3, 0x10900: 1, 0x10901: 4,
+    0x10902: 0, 0x10908: 0, 0x10910: 0, 0x10920: 4, 0x10940: 0, 0x10a0a: 8,
+    0x10a12: 6, 0x10a18: 5, 0x10a1a: 5, 0x10a22: 6, 0x10a28: 4, 0x10a2a: 4,
+    0x10a30: 3, 0x10a32: 3, 0x10a42: 5, 0x10a48: 1, 0x10a4a: 5, 0x10a50: 1,
+    0x10a52: 5, 0x10a58: 5, 0x10a60: 1, 0x10a62: 4, 0x10a68: 4, 0x10a70: 3,
+    0x10b02: 3, 0x10b08: 1, 0x10b0a: 4, 0x10b10: 1, 0x10b12: 3, 0x10b18: 5,
+    0x10b20: 1, 0x10b22: 3, 0x10b28: 4, 0x10b30: 3, 0x10b40: 1, 0x10b42: 3,
+    0x10b48: 1, 0x10b50: 1, 0x10b60: 1, 0x10c09: 6, 0x10c11: 8, 0x10c18: 5,
+    0x10c19: 8, 0x10c21: 4, 0x10c28: 4, 0x10c29: 6, 0x10c30: 3, 0x10c31: 8,
+    0x10c41: 3, 0x10c48: 0, 0x10c50: 0, 0x10c51: 8, 0x10c58: 0, 0x10c60: 0,
+    0x10c61: 3, 0x10c68: 0, 0x10c70: 3, 0x10d01: 4, 0x10d08: 0, 0x10d09: 6,
+    0x10d10: 0, 0x10d18: 0, 0x10d20: 0, 0x10d21: 4, 0x10d28: 4, 0x10d30: 0,
+    0x10d40: 0, 0x10d41: 3, 0x10d48: 0, 0x10d50: 0, 0x10d60: 4, 0x11001: 2,
+    0x11002: 8, 0x11003: 2, 0x11004: 0, 0x11005: 1, 0x11006: 0, 0x11010: 0,
+    0x11011: 8, 0x11012: 2, 0x11014: 6, 0x11020: 0, 0x11021: 8, 0x11022: 2,
+    0x11024: 8, 0x11030: 2, 0x11040: 1, 0x11041: 4, 0x11042: 2, 0x11044: 4,
+    0x11050: 2, 0x11060: 2, 0x11100: 2, 0x11101: 4, 0x11102: 0, 0x11104: 5,
+    0x11110: 0, 0x11120: 2, 0x11140: 4, 0x11206: 6, 0x11212: 6, 0x11214: 6,
+    0x11216: 6, 0x11222: 6, 0x11224: 8, 0x11226: 8, 0x11230: 6, 0x11232: 6,
+    0x11234: 6, 0x11242: 5, 0x11244: 4, 0x11246: 4, 0x11250: 2, 0x11252: 2,
+    0x11260: 2, 0x11262: 2, 0x11264: 8, 0x11270: 2, 0x11302: 6, 0x11304: 5,
+    0x11306: 5, 0x11310: 6, 0x11312: 6, 0x11314: 5, 0x11320: 2, 0x11322: 2,
+    0x11330: 2, 0x11340: 2, 0x11342: 2, 0x11344: 5, 0x11350: 2, 0x11360: 2,
+    0x11405: 4, 0x11411: 8, 0x11414: 6, 0x11415: 8, 0x11421: 4, 0x11424: 8,
+    0x11425: 8, 0x11430: 2, 0x11431: 8, 0x11434: 6, 0x11441: 4, 0x11444: 4,
+    0x11445: 4, 0x11450: 2, 0x11451: 2, 0x11460: 4, 0x11461: 4, 0x11464: 8,
+    0x11470: 2, 0x11501: 4, 0x11504: 5, 0x11505: 5, 0x11510: 0, 0x11514: 0,
+    0x11520: 2, 0x11521: 2, 0x11530: 0, 0x11540: 4, 0x11541: 4, 0x11544: 5,
+    0x11550: 2, 0x11560: 2, 0x11634: 6, 0x11664: 8, 0x11670: 2, 0x11714: 6,
+    0x11730: 2, 0x11744: 5, 0x11750: 2, 0x11760: 2, 0x11770: 2, 0x11803: 8,
+    0x11811: 8, 0x11812: 6, 0x11813: 8, 0x11821: 4, 0x11822: 6, 0x11823: 8,
+    0x11830: 6, 0x11831: 8, 0x11832: 6, 0x11841: 5, 0x11842: 5, 0x11843: 5,
+    0x11850: 1, 0x11851: 8, 0x11852: 5, 0x11860: 1, 0x11861: 8, 0x11862: 0,
+    0x11870: 1, 0x11901: 4, 0x11902: 4, 0x11903: 4, 0x11910: 0, 0x11912: 0,
+    0x11920: 0, 0x11921: 4, 0x11922: 0, 0x11930: 0, 0x11940: 1, 0x11941: 4,
+    0x11942: 0, 0x11950: 0, 0x11960: 1, 0x11a32: 6, 0x11a52: 5, 0x11a62: 8,
+    0x11a70: 1, 0x11a72: 8, 0x11b12: 6, 0x11b22: 6, 0x11b30: 1, 0x11b32: 6,
+    0x11b42: 5, 0x11b50: 1, 0x11b52: 5, 0x11b60: 1, 0x11b62: 4, 0x11b70: 1,
+    0x11c31: 8, 0x11c51: 8, 0x11c61: 4, 0x11c70: 0, 0x11c71: 8, 0x11d21: 4,
+    0x11d30: 0, 0x11d41: 4, 0x11d50: 0, 0x11d60: 0, 0x11d61: 4, 0x11d70: 0,
+    0x12001: 1, 0x12002: 6, 0x12003: 2, 0x12004: 1, 0x12005: 1, 0x12006: 0,
+    0x12008: 1, 0x12009: 6, 0x1200a: 0, 0x1200c: 1, 0x12020: 1, 0x12021: 1,
+    0x12022: 2, 0x12024: 8, 0x12028: 1, 0x12040: 1, 0x12041: 3, 0x12042: 0,
+    0x12044: 1, 0x12048: 0, 0x12060: 1, 0x12100: 1, 0x12101: 1, 0x12102: 2,
+    0x12104: 5, 0x12108: 1, 0x12120: 2, 0x12140: 1, 0x12206: 8, 0x1220a: 8,
+    0x1220c: 6, 0x1220e: 8, 0x12222: 8, 0x12224: 8, 0x12226: 8, 0x12228: 8,
+    0x1222a: 8, 0x1222c: 8, 0x12242: 8, 0x12244: 1, 0x12246: 8, 0x12248: 2,
+    0x1224a: 8, 0x1224c: 1, 0x12260: 2, 0x12262: 8, 0x12264: 8, 0x12268: 2,
+    0x12302: 2, 0x12304: 5, 0x12306: 5, 0x12308: 1, 0x1230a: 2, 0x1230c: 5,
+    0x12320: 2, 0x12322: 2, 0x12328: 2, 0x12340: 1, 0x12342: 2, 0x12344: 5,
+    0x12348: 1, 0x12360: 2, 0x12803: 6, 0x12809: 6, 0x1280a: 6, 0x1280b: 6,
+    0x12821: 8, 0x12822: 6, 0x12823: 6, 0x12828: 6, 0x12829: 6, 0x1282a: 6,
+    0x12841: 3, 0x12842: 0, 0x12843: 3, 0x12848: 0, 0x1284a: 0, 0x12860: 1,
+    0x12861: 3, 0x12862: 0, 0x12868: 0, 0x12901: 1, 0x12902: 6, 0x12903: 6,
+    0x12908: 0, 0x12909: 6, 0x1290a: 6, 0x12920: 0, 0x12921: 1, 0x12922: 6,
+    0x12928: 0, 0x12940: 1, 0x12941: 3, 0x12942: 0, 0x12948: 0, 0x12960: 1,
+    0x12a2a: 6, 0x12a4a: 8, 0x12a62: 8, 0x12a68: 1, 0x12a6a: 8, 0x12b0a: 6,
+    0x12b22: 6, 0x12b28: 1, 0x12b2a: 6, 0x12b42: 3, 0x12b48: 1, 0x12b4a: 5,
+    0x12b60: 1, 0x12b62: 3, 0x12b68: 1, 0x13003: 2, 0x13005: 1, 0x13006: 0,
+    0x13021: 1, 0x13022: 2, 0x13023: 2, 0x13024: 8, 0x13025: 8, 0x13026: 0,
+    0x13041: 2, 0x13042: 5, 0x13043: 2, 0x13044: 1, 0x13045: 1, 0x13046: 0,
+    0x13060: 1, 0x13061: 1, 0x13062: 2, 0x13064: 8, 0x13101: 1, 0x13102: 5,
+    0x13103: 2, 0x13104: 5, 0x13105: 1, 0x13106: 0, 0x13120: 2, 0x13121: 2,
+    0x13122: 2, 0x13140: 2, 0x13141: 1, 0x13142: 5, 0x13144: 5, 0x13160: 2,
+    0x13226: 8, 0x13246: 5, 0x13262: 8, 0x13264: 8, 0x13266: 8, 0x13306: 5,
+    0x13322: 2, 0x13342: 5, 0x13344: 5, 0x13346: 5, 0x13360: 2, 0x13362: 2,
+    0x13823: 6, 0x13843: 5, 0x13861: 1, 0x13862: 0, 0x13863: 8, 0x13903: 5,
+    0x13921: 1, 0x13922: 6, 0x13923: 6, 0x13941: 1, 0x13942: 5, 0x13943: 5,
+    0x13960: 1, 0x13961: 1, 0x13962: 0, 0x14001: 2, 0x14002: 6, 0x14003: 2,
+    0x14004: 0, 0x14005: 1, 0x14006: 0, 0x14008: 2, 0x14009: 6, 0x1400a: 0,
+    0x1400c: 6, 0x14010: 2, 0x14011: 8, 0x14012: 0, 0x14014: 6, 0x14018: 0,
+    0x14040: 0, 0x14041: 3, 0x14042: 2, 0x14044: 4, 0x14048: 0, 0x14050: 2,
+    0x14100: 1, 0x14101: 4, 0x14102: 0, 0x14104: 4, 0x14108: 0, 0x14110: 0,
+    0x14140: 4, 0x14206: 6, 0x1420a: 8, 0x1420c: 4, 0x1420e: 6, 0x14212: 8,
+    0x14214: 6, 0x14216: 6, 0x14218: 8, 0x1421a: 8, 0x1421c: 6, 0x14242: 4,
+    0x14244: 4, 0x14246: 4, 0x14248: 2, 0x1424a: 2, 0x1424c: 4, 0x14250: 2,
+    0x14252: 2, 0x14258: 2, 0x14302: 3, 0x14304: 3, 0x14306: 3, 0x14308: 1,
+    0x1430a: 2, 0x1430c: 6, 0x14310: 1, 0x14312: 3, 0x14314: 6, 0x14318: 1,
+    0x14340: 1, 0x14342: 2, 0x14344: 4, 0x14348: 1, 0x14350: 2, 0x14405: 4,
+    0x14409: 6, 0x1440c: 4, 0x1440d: 6, 0x14411: 8, 0x14414: 6, 0x14415: 6,
+    0x14418: 0, 0x14419: 8, 0x1441c: 6, 0x14441: 3, 0x14444: 4, 0x14445: 3,
+    0x14448: 0, 0x1444c: 0, 0x14450: 2, 0x14451: 2, 0x14458: 2, 0x14501: 4,
+    0x14504: 4, 0x14505: 4, 0x14508: 4, 0x14509: 6, 0x1450c: 4, 0x14510: 0,
+    0x14514: 0, 0x14518: 0, 0x14540: 4, 0x14541: 3, 0x14544: 4, 0x14548: 0,
+    0x14550: 0, 0x1461c: 6, 0x1464c: 4, 0x14658: 2, 0x1470c: 4, 0x14714: 6,
+    0x14718: 2, 0x1471c: 6, 0x14744: 4, 0x14748: 2, 0x1474c: 4, 0x14750: 2,
+    0x14758: 2, 0x14803: 8, 0x14809: 6, 0x1480a: 8, 0x1480b: 6, 0x14811: 8,
+    0x14812: 8, 0x14813: 8, 0x14818: 8, 0x14819: 8, 0x1481a: 8, 0x14841: 3,
+    0x14842: 8, 0x14843: 3, 0x14848: 0, 0x1484a: 0, 0x14850: 8, 0x14851: 3,
+    0x14852: 8, 0x14858: 0, 0x14901: 4, 0x14902: 3, 0x14903: 4, 0x14908: 0,
+    0x14909: 6, 0x1490a: 0, 0x14910: 0, 0x14912: 0, 0x14918: 0, 0x14940: 0,
+    0x14941: 3, 0x14942: 0, 0x14948: 0, 0x14950: 0, 0x14a1a: 8, 0x14a4a: 8,
+    0x14a52: 8, 0x14a58: 1, 0x14a5a: 8, 0x14b0a: 6, 0x14b12: 3, 0x14b18: 1,
+    0x14b1a: 6, 0x14b42: 3, 0x14b48: 1, 0x14b4a: 4, 0x14b50: 1, 0x14b52: 3,
+    0x14b58: 1, 0x14c19: 8, 0x14c51: 8, 0x14c58: 0, 0x14d09: 6, 0x14d18: 0,
+    0x14d41: 3, 0x14d48: 0, 0x14d50: 0, 0x14d58: 0, 0x15003: 2, 0x15005: 1,
+    0x15006: 0, 0x15011: 8, 0x15012: 0, 0x15013: 8, 0x15014: 6, 0x15015: 6,
+    0x15016: 6, 0x15041: 4, 0x15042: 4, 0x15043: 2, 0x15044: 4, 0x15045: 1,
+    0x15046: 0, 0x15050: 2, 0x15051: 2, 0x15052: 2, 0x15101: 4, 0x15102: 4,
+    0x15103: 2, 0x15104: 4, 0x15105: 1, 0x15106: 0, 0x15110: 0, 0x15112: 0,
+    0x15114: 0, 0x15140: 4, 0x15141: 4, 0x15142: 4, 0x15144: 4, 0x15150: 0,
+    0x15216: 6, 0x15246: 4, 0x15252: 2, 0x15306: 6, 0x15312: 6, 0x15314: 6,
+    0x15316: 6, 0x15342: 4, 0x15344: 4, 0x15346: 4, 0x15350: 2, 0x15352: 2,
+    0x15415: 6, 0x15445: 4, 0x15451: 2, 0x15505: 4, 0x15514: 0, 0x15541: 4,
+    0x15544: 4, 0x15545: 4, 0x15550: 0, 0x15813: 8, 0x15843: 8, 0x15851: 8,
+    0x15852: 8, 0x15853: 8, 0x15903: 4, 0x15912: 0, 0x15941: 4, 0x15942: 4,
+    0x15943: 4, 0x15950: 0, 0x15952: 0, 0x16003: 2, 0x16005: 1, 0x16006: 0,
+    0x16009: 6, 0x1600a: 0, 0x1600b: 2, 0x1600c: 1, 0x1600d: 6, 0x1600e: 0,
+    0x16041: 3, 0x16042: 3, 0x16043: 2, 0x16044: 1, 0x16045: 1, 0x16046: 0,
+    0x16048: 0, 0x1604a: 0, 0x1604c: 0, 0x16101: 1, 0x16102: 3, 0x16103: 2,
+    0x16104: 0, 0x16105: 1, 0x16106: 0, 0x16108: 1, 0x16109: 6, 0x1610a: 0,
+    0x1610c: 1, 0x16140: 0, 0x16141: 3, 0x16142: 3, 0x16144: 1, 0x16148: 0,
+    0x1620e: 8, 0x16246: 3, 0x1624a: 8, 0x1624c: 1, 0x1624e: 8, 0x16306: 3,
+    0x1630a: 2, 0x1630c: 1, 0x1630e: 6, 0x16342: 3, 0x16344: 1, 0x16346: 3,
+    0x16348: 1, 0x1634a: 2, 0x1634c: 1, 0x1680b: 6, 0x16843: 3, 0x1684a: 0,
+    0x16903: 3, 0x16909: 6, 0x1690a: 6, 0x1690b: 6, 0x16941: 3, 0x16942: 3,
+    0x16943: 3, 0x16948: 0, 0x1694a: 0, 0x18001: 8, 0x18002: 8, 0x18003: 2,
+    0x18004: 8, 0x18005: 1, 0x18006: 0, 0x18008: 8, 0x18009: 8, 0x1800a: 8,
+    0x1800c: 8, 0x18010: 8, 0x18011: 8, 0x18012: 8, 0x18014: 8, 0x18018: 5,
+    0x18020: 8, 0x18021: 8, 0x18022: 8, 0x18024: 8, 0x18028: 4, 0x18030: 3,
+    0x18100: 2, 0x18101: 4, 0x18102: 0, 0x18104: 5, 0x18108: 4, 0x18110: 0,
+    0x18120: 2, 0x18206: 8, 0x1820a: 8, 0x1820c: 8, 0x1820e: 8, 0x18212: 8,
+    0x18214: 8, 0x18216: 8, 0x18218: 5, 0x1821a: 5, 0x1821c: 5, 0x18222: 8,
+    0x18224: 8, 0x18226: 8, 0x18228: 4, 0x1822a: 4, 0x1822c: 8, 0x18230: 3,
+    0x18232: 3, 0x18234: 8, 0x18302: 3, 0x18304: 5, 0x18306: 5, 0x18308: 5,
+    0x1830a: 5, 0x1830c: 5, 0x18310: 3, 0x18312: 3, 0x18314: 5, 0x18318: 5,
+    0x18320: 2, 0x18322: 2, 0x18328: 2, 0x18330: 2, 0x18405: 8, 0x18409: 8,
+    0x1840c: 8, 0x1840d: 4, 0x18411: 8, 0x18414: 8, 0x18415: 8, 0x18418: 5,
+    0x18419: 8, 0x1841c: 5, 0x18421: 8, 0x18424: 8, 0x18425: 8, 0x18428: 4,
+    0x18429: 4, 0x1842c: 8, 0x18430: 3, 0x18431: 8, 0x18434: 8, 0x18501: 4,
+    0x18504: 5, 0x18505: 5, 0x18508: 4, 0x18509: 4, 0x1850c: 5, 0x18510: 0,
+    0x18514: 0, 0x18518: 0, 0x18520: 2, 0x18521: 2, 0x18528: 2, 0x18530: 0,
+    0x1861c: 5, 0x1862c: 8, 0x18634: 8, 0x1870c: 5, 0x18714: 5, 0x18718: 5,
+    0x1871c: 5, 0x18728: 2, 0x18730: 2, 0x18803: 8, 0x18809: 8, 0x1880a: 5,
+    0x1880b: 4, 0x18811: 8, 0x18812: 8, 0x18813: 8, 0x18818: 5, 0x18819: 8,
+    0x1881a: 5, 0x18821: 8, 0x18822: 3, 0x18823: 8, 0x18828: 4, 0x18829: 4,
+    0x1882a: 4, 0x18830: 3, 0x18831: 8, 0x18832: 3, 0x18901: 4, 0x18902: 4,
+    0x18903: 4, 0x18908: 4, 0x18909: 4, 0x1890a: 4, 0x18910: 0, 0x18912: 0,
+    0x18918: 0, 0x18920: 4, 0x18921: 4, 0x18922: 4, 0x18928: 4, 0x18930: 3,
+    0x18a1a: 5, 0x18a2a: 4, 0x18a32: 3, 0x18b0a: 4, 0x18b12: 3, 0x18b18: 5,
+    0x18b1a: 5, 0x18b22: 3, 0x18b28: 4, 0x18b2a: 4, 0x18b30: 3, 0x18b32: 3,
+    0x18c19: 8, 0x18c29: 4, 0x18c31: 8, 0x18d09: 4, 0x18d18: 0, 0x18d21: 4,
+    0x18d28: 4, 0x18d29: 4, 0x18d30: 0, 0x19003: 2, 0x19005: 1, 0x19006: 0,
+    0x19011: 8, 0x19012: 2, 0x19013: 2, 0x19014: 0, 0x19015: 8, 0x19016: 0,
+    0x19021: 8, 0x19022: 2, 0x19023: 2, 0x19024: 8, 0x19025: 8, 0x19026: 0,
+    0x19030: 2, 0x19031: 8, 0x19032: 2, 0x19034: 8, 0x19101: 4, 0x19102: 0,
+    0x19103: 2, 0x19104: 5, 0x19105: 1, 0x19106: 0, 0x19110: 0, 0x19112: 0,
+    0x19114: 0, 0x19120: 2, 0x19121: 2, 0x19122: 2, 0x19130: 2, 0x19415: 8,
+    0x19425: 8, 0x19431: 8, 0x19434: 8, 0x19435: 8, 0x19505: 5, 0x19514: 0,
+    0x19521: 2, 0x19530: 0, 0x19813: 8, 0x19823: 8, 0x19831: 8, 0x19832: 0,
+    0x19833: 8, 0x19903: 4, 0x19912: 0, 0x19921: 4, 0x19922: 0, 0x19923: 4,
+    0x19930: 0, 0x19932: 0, 0x1a003: 2, 0x1a005: 1, 0x1a006: 0, 0x1a009: 8,
+    0x1a00a: 2, 0x1a00b: 2, 0x1a00c: 8, 0x1a00d: 1, 0x1a00e: 0, 0x1a021: 8,
+    0x1a022: 2, 0x1a023: 2, 0x1a024: 8, 0x1a025: 8, 0x1a026: 0, 0x1a028: 2,
+    0x1a029: 1, 0x1a02a: 2, 0x1a02c: 8, 0x1a101: 1, 0x1a102: 2, 0x1a103: 2,
+    0x1a104: 5, 0x1a105: 1, 0x1a106: 0, 0x1a108: 0, 0x1a109: 1, 0x1a10a: 2,
+    0x1a10c: 5, 0x1a120: 2, 0x1a121: 2, 0x1a122: 2, 0x1a128: 2, 0x1a20e: 8,
+    0x1a226: 8, 0x1a22a: 8, 0x1a22c: 8, 0x1a22e: 8, 0x1a306: 5, 0x1a30a: 2,
+    0x1a30c: 5, 0x1a30e: 5, 0x1a322: 2, 0x1a328: 2, 0x1a32a: 2, 0x1b023: 2,
+    0x1b025: 8, 0x1b026: 0, 0x1b103: 2, 0x1b105: 1, 0x1b106: 0, 0x1b121: 2,
+    0x1b122: 2, 0x1b123: 2, 0x1c003: 2, 0x1c005: 1, 0x1c006: 0, 0x1c009: 8,
+    0x1c00a: 8, 0x1c00b: 2, 0x1c00c: 8, 0x1c00d: 1, 0x1c00e: 0, 0x1c011: 8,
+    0x1c012: 8, 0x1c013: 8, 0x1c014: 8, 0x1c015: 1, 0x1c016: 0, 0x1c018: 8,
+    0x1c019: 8, 0x1c01a: 8, 0x1c01c: 8, 0x1c101: 4, 0x1c102: 0, 0x1c103: 2,
+    0x1c104: 0, 0x1c105: 1, 0x1c106: 0, 0x1c108: 1, 0x1c109: 4, 0x1c10a: 0,
+    0x1c10c: 0, 0x1c110: 0, 0x1c112: 0, 0x1c114: 0, 0x1c118: 0, 0x1c20e: 8,
+    0x1c216: 3, 0x1c21a: 8, 0x1c21c: 8, 0x1c21e: 8, 0x1c306: 3, 0x1c30a: 2,
+    0x1c30c: 1, 0x1c30e: 4, 0x1c312: 3, 0x1c314: 3, 0x1c316: 3, 0x1c318: 1,
+    0x1c31a: 2, 0x1c31c: 1, 0x1c40d: 8, 0x1c415: 8, 0x1c419: 8, 0x1c41c: 8,
+    0x1c41d: 8, 0x1c505: 4, 0x1c509: 4, 0x1c50c: 4, 0x1c50d: 4, 0x1c514: 0,
+    0x1c518: 0, 0x1c51c: 0, 0x1c80b: 8, 0x1c813: 8, 0x1c819: 8, 0x1c81a: 8,
+    0x1c81b: 8, 0x1c903: 4, 0x1c909: 4, 0x1c90a: 4, 0x1c90b: 4, 0x1c912: 0,
+    0x1c918: 0, 0x1c91a: 0, 0x1d013: 8, 0x1d015: 8, 0x1d016: 0, 0x1d103: 2,
+    0x1d105: 1, 0x1d106: 0, 0x1d112: 0, 0x1d114: 0, 0x1d116: 0, 0x1e00b: 2,
+    0x1e00d: 1, 0x1e00e: 0, 0x1e103: 2, 0x1e105: 1, 0x1e106: 0, 0x1e109: 1,
+    0x1e10a: 2, 0x1e10b: 2, 0x1e10c: 1, 0x1e10d: 1, 0x1e10e: 0, 0x20000: 4,
+    0x20001: 2, 0x20002: 2, 0x20004: 6, 0x20008: 6, 0x20010: 0, 0x20020: 0,
+    0x20040: 2, 0x20080: 0, 0x20202: 4, 0x20204: 4, 0x20206: 4, 0x20208: 4,
+    0x2020a: 4, 0x2020c: 4, 0x20210: 1, 0x20212: 7, 0x20214: 6, 0x20218: 5,
+    0x20220: 4, 0x20222: 4, 0x20224: 4, 0x20228: 4, 0x20230: 3, 0x20240: 4,
+    0x20242: 4, 0x20244: 4, 0x20248: 4, 0x20250: 2, 0x20260: 4, 0x20280: 4,
+    0x20282: 4, 0x20284: 4, 0x20288: 4, 0x20290: 1, 0x202a0: 4, 0x202c0: 4,
+    0x20401: 7, 0x20404: 7, 0x20405: 6, 0x20408: 4, 0x20409: 6, 0x2040c: 6,
+    0x20410: 0, 0x20411: 6, 0x20414: 6, 0x20418: 5, 0x20420: 4, 0x20421: 3,
+    0x20424: 4, 0x20428: 4, 0x20430: 3, 0x20440: 0, 0x20441: 3, 0x20444: 4,
+    0x20448: 0, 0x20450: 2, 0x20460: 4, 0x20480: 0, 0x20481: 6, 0x20484: 6,
+    0x20488: 0, 0x20490: 0, 0x204a0: 0, 0x204c0: 2, 0x2060c: 4, 0x20614: 6,
+    0x20618: 5, 0x2061c: 6, 0x20624: 4, 0x20628: 4, 0x2062c: 4, 0x20630: 3,
+    0x20634: 3, 0x20644: 4, 0x20648: 2, 0x2064c: 4, 0x20650: 2, 0x20658: 2,
+    0x20660: 2, 0x20664: 4, 0x20668: 4, 0x20670: 2, 0x20684: 4, 0x20688: 5,
+    0x2068c: 4, 0x20690: 2, 0x20694: 6, 0x20698: 5, 0x206a0: 3, 0x206a4: 4,
+    0x206a8: 4, 0x206b0: 3, 0x206c0: 2, 0x206c4: 4, 0x206c8: 4, 0x206d0: 2,
+    0x206e0: 2, 0x20801: 5, 0x20802: 5, 0x20803: 5, 0x20808: 5, 0x20809: 6,
+    0x2080a: 5, 0x20810: 5, 0x20811: 5, 0x20812: 7, 0x20818: 5, 0x20820: 4,
+    0x20821: 3, 0x20822: 4, 0x20828: 4, 0x20830: 3, 0x20840: 5, 0x20841: 3,
+    0x20842: 5, 0x20848: 0, 0x20850: 5, 0x20860: 3, 0x20880: 5, 0x20881: 5,
+    0x20882: 4, 0x20888: 5, 0x20890: 1, 0x208a0: 4, 0x208c0: 5, 0x20a0a: 7,
+    0x20a12: 7, 0x20a18: 5, 0x20a1a: 7, 0x20a22: 4, 0x20a28: 4, 0x20a2a: 4,
+    0x20a30: 3, 0x20a32: 3, 0x20a42: 5, 0x20a48: 5, 0x20a4a: 5, 0x20a50: 1,
+    0x20a52: 7, 0x20a58: 5, 0x20a60: 1, 0x20a62: 4, 0x20a68: 4, 0x20a70: 3,
+    0x20a82: 4, 0x20a88: 1, 0x20a8a: 4, 0x20a90: 1, 0x20a98: 1, 0x20aa0: 3,
+    0x20aa2: 4, 0x20aa8: 4, 0x20ab0: 3, 0x20ac0: 1, 0x20ac2: 4, 0x20ac8: 1,
+    0x20ad0: 1, 0x20ae0: 1, 0x20c09: 6, 0x20c11: 5, 0x20c18: 5, 0x20c19: 6,
+    0x20c21: 3, 0x20c28: 4, 0x20c29: 6, 0x20c30: 3, 0x20c31: 3, 0x20c41: 3,
+    0x20c48: 0, 0x20c50: 0, 0x20c51: 3, 0x20c58: 0, 0x20c60: 0, 0x20c61: 3,
+    0x20c68: 0, 0x20c70: 3, 0x20c81: 5, 0x20c88: 0, 0x20c89: 6, 0x20c90: 0,
+    0x20c91: 5, 0x20c98: 5, 0x20ca0: 0, 0x20ca1: 3, 0x20ca8: 4, 0x20cb0: 3,
+    0x20cc0: 0, 0x20cc1: 3, 0x20cc8: 0, 0x20cd0: 0, 0x20ce0: 0, 0x21001: 5,
+    0x21002: 4, 0x21003: 2, 0x21004: 0, 0x21005: 1, 0x21006: 0, 0x21010: 0,
+    0x21011: 2, 0x21012: 7, 0x21014: 6, 0x21020: 0, 0x21021: 2, 0x21022: 0,
+    0x21024: 6, 0x21030: 0, 0x21040: 5, 0x21041: 2, 0x21042: 2, 0x21044: 4,
+    0x21050: 2, 0x21060: 2, 0x21080: 4, 0x21081: 1, 0x21082: 4, 0x21084: 4,
+    0x21090: 1, 0x210a0: 0, 0x210c0: 4, 0x21206: 6, 0x21212: 7, 0x21214: 6,
+    0x21216: 6, 0x21222: 7, 0x21224: 6, 0x21226: 4, 0x21230: 6, 0x21232: 7,
+    0x21234: 6, 0x21242: 4, 0x21244: 4, 0x21246: 4, 0x21250: 2, 0x21252: 2,
+    0x21260: 4, 0x21262: 4, 0x21264: 4, 0x21270: 2, 0x21282: 4, 0x21284: 6,
+    0x21286: 4, 0x21290: 1, 0x21294: 6, 0x212a0: 1, 0x212a2: 4, 0x212a4: 6,
+    0x212b0: 1, 0x212c0: 4, 0x212c2: 4, 0x212c4: 4, 0x212d0: 1, 0x212e0: 4,
+    0x21405: 7, 0x21411: 5, 0x21414: 6, 0x21415: 6, 0x21421: 7, 0x21424: 6,
+    0x21425: 7, 0x21430: 0, 0x21431: 7, 0x21434: 6, 0x21441: 5, 0x21444: 4,
+    0x21445: 4, 0x21450: 2, 0x21451: 2, 0x21460: 4, 0x21461: 2, 0x21464: 4,
+    0x21470: 2, 0x21481: 5, 0x21484: 4, 0x21485: 6, 0x21490: 0, 0x21491: 5,
+    0x21494: 6, 0x214a0: 0, 0x214a1: 2, 0x214a4: 6, 0x214b0: 0, 0x214c0: 2,
+    0x214c1: 5, 0x214c4: 4, 0x214d0: 2, 0x214e0: 2, 0x21634: 6, 0x21664: 4,
+    0x21670: 2, 0x21694: 6, 0x216a4: 6, 0x216b0: 2, 0x216b4: 6, 0x216c4: 4,
+    0x216d0: 2, 0x216e0: 2, 0x216e4: 4, 0x216f0: 2, 0x21803: 5, 0x21811: 5,
+    0x21812: 7, 0x21813: 7, 0x21821: 7, 0x21822: 6, 0x21823: 7, 0x21830: 0,
+    0x21831: 7, 0x21832: 7, 0x21841: 5, 0x21842: 5, 0x21843: 5, 0x21850: 5,
+    0x21851: 5, 0x21852: 7, 0x21860: 1, 0x21861: 1, 0x21862: 4, 0x21870: 1,
+    0x21881: 5, 0x21882: 4, 0x21883: 4, 0x21890: 1, 0x21891: 1, 0x218a0: 0,
+    0x218a1: 4, 0x218a2: 4, 0x218b0: 1, 0x218c0: 5, 0x218c1: 5, 0x218c2: 4,
+    0x218d0: 1, 0x218e0: 1, 0x21a32: 7, 0x21a52: 7, 0x21a62: 4, 0x21a70: 1,
+    0x21a72: 7, 0x21aa2: 4, 0x21ab0: 1, 0x21ac2: 4, 0x21ad0: 1, 0x21ae0: 1,
+    0x21ae2: 4, 0x21af0: 1, 0x21c31: 7, 0x21c51: 5, 0x21c61: 7, 0x21c70: 0,
+    0x21c71: 7, 0x21c91: 5, 0x21ca1: 6, 0x21cb0: 0, 0x21cb1: 6, 0x21cc1: 5,
+    0x21cd0: 5, 0x21cd1: 5, 0x21ce0: 0, 0x21ce1: 4, 0x21cf0: 0, 0x22001: 2,
+    0x22002: 0, 0x22003: 2, 0x22004: 0, 0x22005: 1, 0x22006: 0, 0x22008: 0,
+    0x22009: 6, 0x2200a: 0, 0x2200c: 0, 0x22020: 0, 0x22021: 7, 0x22022: 0,
+    0x22024: 0, 0x22028: 0, 0x22040: 0, 0x22041: 3, 0x22042: 0, 0x22044: 0,
+    0x22048: 0, 0x22060: 0, 0x22080: 0, 0x22081: 5, 0x22082: 0, 0x22084: 0,
+    0x22088: 0, 0x220a0: 0, 0x220c0: 0, 0x22405: 7, 0x22409: 6, 0x2240c: 6,
+    0x2240d: 6, 0x22421: 7, 0x22424: 6, 0x22425: 7, 0x22428: 0, 0x22429: 6,
+    0x2242c: 6, 0x22441: 3, 0x22444: 7, 0x22445: 3, 0x22448: 0, 0x2244c: 0,
+    0x22460: 2, 0x22461: 3, 0x22464: 7, 0x22468: 0, 0x22481: 6, 0x22484: 0,
+    0x22485: 6, 0x22488: 0, 0x22489: 6, 0x2248c: 0, 0x224a0: 0, 0x224a1: 6,
+    0x224a4: 0, 0x224a8: 0, 0x224c0: 0, 0x224c1: 3, 0x224c4: 0, 0x224c8: 0,
+    0x224e0: 0, 0x22803: 7, 0x22809: 6, 0x2280a: 6, 0x2280b: 6, 0x22821: 6,
+    0x22822: 6, 0x22823: 6, 0x22828: 0, 0x22829: 6, 0x2282a: 6, 0x22841: 3,
+    0x22842: 0, 0x22843: 3, 0x22848: 0, 0x2284a: 0, 0x22860: 0, 0x22861: 3,
+    0x22862: 0, 0x22868: 0, 0x22881: 6, 0x22882: 0, 0x22883: 6, 0x22888: 0,
+    0x22889: 6, 0x2288a: 0, 0x228a0: 0, 0x228a1: 6, 0x228a2: 0, 0x228a8: 0,
+    0x228c0: 1, 0x228c1: 3, 0x228c2: 0, 0x228c8: 0, 0x228e0: 0, 0x22c29: 6,
+    0x22c61: 3, 0x22c68: 0, 0x22c89: 6, 0x22ca1: 6, 0x22ca8: 0, 0x22ca9: 6,
+    0x22cc1: 3, 0x22cc8: 0, 0x22ce0: 0, 0x22ce1: 3, 0x22ce8: 0, 0x23003: 2,
+    0x23005: 1, 0x23006: 0, 0x23021: 2, 0x23022: 0, 0x23023: 2, 0x23024: 0,
+    0x23025: 1, 0x23026: 0, 0x23041: 5, 0x23042: 2, 0x23043: 2, 0x23044: 5,
+    0x23045: 1, 0x23046: 0, 0x23060: 0, 0x23061: 2, 0x23062: 0, 0x23064: 0,
+    0x23081: 5, 0x23082: 0, 0x23083: 2, 0x23084: 6, 0x23085: 1, 0x23086: 0,
+    0x230a0: 0, 0x230a1: 2, 0x230a2: 0, 0x230a4: 0, 0x230c0: 2, 0x230c1: 5,
+    0x230c2: 2, 0x230c4: 5, 0x230e0: 0, 0x23425: 7, 0x23445: 5, 0x23461: 7,
+    0x23464: 7, 0x23465: 7, 0x23485: 5, 0x234a1: 2, 0x234a4: 0, 0x234a5: 6,
+    0x234c1: 5, 0x234c4: 5, 0x234c5: 5, 0x234e0: 0, 0x234e1: 2, 0x234e4: 0,
+    0x23823: 6, 0x23843: 5, 0x23861: 1, 0x23862: 0, 0x23863: 7, 0x23883: 5,
+    0x238a1: 6, 0x238a2: 0, 0x238a3: 6, 0x238c1: 5, 0x238c2: 5, 0x238c3: 5,
+    0x238e0: 0, 0x238e1: 1, 0x238e2: 0, 0x24001: 2, 0x24002: 2, 0x24003: 2,
+    0x24004: 0, 0x24005: 1, 0x24006: 0, 0x24008: 2, 0x24009: 6, 0x2400a: 2,
+    0x2400c: 6, 0x24010: 2, 0x24011: 2, 0x24012: 7, 0x24014: 6, 0x24018: 2,
+    0x24040: 2, 0x24041: 3, 0x24042: 2, 0x24044: 4, 0x24048: 0, 0x24050: 2,
+    0x24080: 2, 0x24081: 2, 0x24082: 4, 0x24084: 4, 0x24088: 2, 0x24090: 1,
+    0x240c0: 2, 0x24206: 4, 0x2420a: 7, 0x2420c: 4, 0x2420e: 4, 0x24212: 7,
+    0x24214: 6, 0x24216: 7, 0x24218: 2, 0x2421a: 7, 0x2421c: 6, 0x24242: 2,
+    0x24244: 4, 0x24246: 4, 0x24248: 2, 0x2424a: 2, 0x2424c: 4, 0x24250: 2,
+    0x24252: 2, 0x24258: 2, 0x24282: 4, 0x24284: 4, 0x24286: 4, 0x24288: 1,
+    0x2428a: 4, 0x2428c: 4, 0x24290: 1, 0x24294: 6, 0x24298: 1, 0x242c0: 2,
+    0x242c2: 4, 0x242c4: 4, 0x242c8: 4, 0x242d0: 2, 0x24405: 6, 0x24409: 6,
+    0x2440c: 6, 0x2440d: 6, 0x24411: 2, 0x24414: 6, 0x24415: 6, 0x24418: 2,
+    0x24419: 6, 0x2441c: 6, 0x24441: 3, 0x24444: 4, 0x24445: 3, 0x24448: 0,
+    0x2444c: 0, 0x24450: 2, 0x24451: 3, 0x24458: 2, 0x24481: 2, 0x24484: 3,
+    0x24485: 6, 0x24488: 2, 0x24489: 6, 0x2448c: 6, 0x24490: 2, 0x24491: 2,
+    0x24494: 6, 0x24498: 2, 0x244c0: 2, 0x244c1: 3, 0x244c4: 4, 0x244c8: 0,
+    0x244d0: 2, 0x2461c: 6, 0x2464c: 4, 0x24658: 2, 0x2468c: 4, 0x24694: 6,
+    0x24698: 2, 0x2469c: 6, 0x246c4: 4, 0x246c8: 2, 0x246cc: 4, 0x246d0: 2,
+    0x246d8: 2, 0x25003: 2, 0x25005: 1, 0x25006: 0, 0x25011: 2, 0x25012: 7,
+    0x25013: 2, 0x25014: 6, 0x25015: 6, 0x25016: 6, 0x25041: 2, 0x25042: 2,
+    0x25043: 2, 0x25044: 4, 0x25045: 1, 0x25046: 0, 0x25050: 2, 0x25051: 2,
+    0x25052: 2, 0x25081: 2, 0x25082: 4, 0x25083: 2, 0x25084: 4, 0x25085: 1,
+    0x25086: 0, 0x25090: 1, 0x25091: 1, 0x25094: 6, 0x250c0: 2, 0x250c1: 4,
+    0x250c2: 4, 0x250c4: 4, 0x250d0: 2, 0x25216: 6, 0x25246: 4, 0x25252: 2,
+    0x25286: 4, 0x25294: 6, 0x252c2: 4, 0x252c4: 4, 0x252c6: 4, 0x252d0: 2,
+    0x25415: 6, 0x25445: 4, 0x25451: 2, 0x25485: 4, 0x25491: 2, 0x25494: 6,
+    0x25495: 6, 0x254c1: 2, 0x254c4: 4, 0x254c5: 4, 0x254d0: 2, 0x254d1: 2,
+    0x26003: 2, 0x26005: 1, 0x26006: 0, 0x26009: 6, 0x2600a: 0, 0x2600b: 6,
+    0x2600c: 0, 0x2600d: 6, 0x2600e: 0, 0x26041: 3, 0x26042: 2, 0x26043: 2,
+    0x26044: 3, 0x26045: 3, 0x26046: 0, 0x26048: 0, 0x2604a: 0, 0x2604c: 0,
+    0x26081: 2, 0x26082: 0, 0x26083: 2, 0x26084: 6, 0x26085: 1, 0x26086: 0,
+    0x26088: 0, 0x26089: 6, 0x2608a: 0, 0x2608c: 0, 0x260c0: 2, 0x260c1: 3,
+    0x260c2: 3, 0x260c4: 3, 0x260c8: 0, 0x2640d: 6, 0x26445: 3, 0x2644c: 0,
+    0x26485: 3, 0x26489: 6, 0x2648c: 0, 0x2648d: 6, 0x264c1: 3, 0x264c4: 3,
+    0x264c5: 3, 0x264c8: 0, 0x264cc: 0, 0x28001: 7, 0x28002: 7, 0x28003: 2,
+    0x28004: 7, 0x28005: 1, 0x28006: 0, 0x28008: 7, 0x28009: 7, 0x2800a: 7,
+    0x2800c: 7, 0x28010: 7, 0x28011: 7, 0x28012: 7, 0x28014: 7, 0x28018: 5,
+    0x28020: 7, 0x28021: 7, 0x28022: 7, 0x28024: 7, 0x28028: 4, 0x28030: 3,
+    0x28080: 4, 0x28081: 1, 0x28082: 4, 0x28084: 1, 0x28088: 4, 0x28090: 1,
+    0x280a0: 4, 0x28206: 7, 0x2820a: 5, 0x2820c: 7, 0x2820e: 7, 0x28212: 7,
+    0x28214: 3, 0x28216: 7, 0x28218: 5, 0x2821a: 5, 0x2821c: 5, 0x28222: 3,
+    0x28224: 3, 0x28226: 3, 0x28228: 4, 0x2822a: 4, 0x2822c: 4, 0x28230: 3,
+    0x28232: 3, 0x28234: 3, 0x28282: 4, 0x28284: 3, 0x28286: 4, 0x28288: 4,
+    0x2828a: 4, 0x2828c: 4, 0x28290: 1, 0x28294: 1, 0x28298: 1, 0x282a0: 1,
+    0x282a2: 4, 0x282a4: 3, 0x282a8: 4, 0x282b0: 1, 0x28405: 7, 0x28409: 7,
+    0x2840c: 7, 0x2840d: 7, 0x28411: 7, 0x28414: 7, 0x28415: 7, 0x28418: 5,
+    0x28419: 5, 0x2841c: 5, 0x28421: 7, 0x28424: 7, 0x28425: 7, 0x28428: 4,
+    0x28429: 4, 0x2842c: 4, 0x28430: 3, 0x28431: 3, 0x28434: 3, 0x28481: 5,
+    0x28484: 3, 0x28485: 3, 0x28488: 2, 0x28489: 5, 0x2848c: 4, 0x28490: 0,
+    0x28491: 5, 0x28494: 3, 0x28498: 5, 0x284a0: 0, 0x284a1: 4, 0x284a4: 3,
+    0x284a8: 4, 0x284b0: 3, 0x2861c: 5, 0x2862c: 4, 0x28634: 3, 0x2868c: 4,
+    0x28694: 3, 0x28698: 5, 0x2869c: 5, 0x286a4: 3, 0x286a8: 4, 0x286ac: 4,
+    0x286b0: 3, 0x286b4: 3, 0x28803: 7, 0x28809: 5, 0x2880a: 5, 0x2880b: 5,
+    0x28811: 5, 0x28812: 7, 0x28813: 7, 0x28818: 5, 0x28819: 5, 0x2881a: 5,
+    0x28821: 7, 0x28822: 3, 0x28823: 7, 0x28828: 4, 0x28829: 4, 0x2882a: 4,
+    0x28830: 3, 0x28831: 3, 0x28832: 3, 0x28881: 5, 0x28882: 4, 0x28883: 4,
+    0x28888: 1, 0x28889: 5, 0x2888a: 4, 0x28890: 1, 0x28891: 1, 0x28898: 1,
+    0x288a0: 4, 0x288a1: 4, 0x288a2: 4, 0x288a8: 4, 0x288b0: 1, 0x28a1a: 5,
+    0x28a2a: 4, 0x28a32: 3, 0x28a8a: 4, 0x28a98: 1, 0x28aa2: 4, 0x28aa8: 4,
+    0x28aaa: 4, 0x28ab0: 1, 0x28c19: 5, 0x28c29: 4, 0x28c31: 3, 0x28c89: 5,
+    0x28c91: 5, 0x28c98: 5, 0x28c99: 5, 0x28ca1: 4, 0x28ca8: 4, 0x28ca9: 4,
+    0x28cb0: 3, 0x28cb1: 3, 0x29003: 2, 0x29005: 1, 0x29006: 0, 0x29011: 7,
+    0x29012: 7, 0x29013: 2, 0x29014: 0, 0x29015: 1, 0x29016: 0, 0x29021: 7,
+    0x29022: 0, 0x29023: 2, 0x29024: 0, 0x29025: 1, 0x29026: 0, 0x29030: 0,
+    0x29031: 7, 0x29032: 7, 0x29034: 0, 0x29081: 1, 0x29082: 4, 0x29083: 2,
+    0x29084: 0, 0x29085: 1, 0x29086: 0, 0x29090: 1, 0x29091: 1, 0x29094: 1,
+    0x290a0: 0, 0x290a1: 1, 0x290a2: 4, 0x290a4: 0, 0x290b0: 1, 0x29415: 7,
+    0x29425: 7, 0x29431: 7, 0x29434: 7, 0x29435: 7, 0x29485: 5, 0x29491: 5,
+    0x29494: 0, 0x29495: 5, 0x294a1: 2, 0x294a4: 0, 0x294a5: 4, 0x294b0: 0,
+    0x294b1: 2, 0x294b4: 0, 0x29813: 7, 0x29823: 7, 0x29831: 7, 0x29832: 7,
+    0x29833: 7, 0x29883: 4, 0x29891: 1, 0x298a1: 4, 0x298a2: 4, 0x298a3: 4,
+    0x298b0: 1, 0x298b1: 1, 0x2a003: 2, 0x2a005: 1, 0x2a006: 0, 0x2a009: 5,
+    0x2a00a: 2, 0x2a00b: 2, 0x2a00c: 0, 0x2a00d: 1, 0x2a00e: 0, 0x2a021: 2,
+    0x2a022: 0, 0x2a023: 2, 0x2a024: 3, 0x2a025: 1, 0x2a026: 0, 0x2a028: 0,
+    0x2a029: 2, 0x2a02a: 0, 0x2a02c: 0, 0x2a081: 2, 0x2a082: 0, 0x2a083: 2,
+    0x2a084: 0, 0x2a085: 1, 0x2a086: 0, 0x2a088: 2, 0x2a089: 2, 0x2a08a: 2,
+    0x2a08c: 0, 0x2a0a0: 0, 0x2a0a1: 2, 0x2a0a2: 0, 0x2a0a4: 0, 0x2a0a8: 0,
+    0x2a40d: 7, 0x2a425: 7, 0x2a429: 7, 0x2a42c: 7, 0x2a42d: 7, 0x2a485: 3,
+    0x2a489: 2, 0x2a48c: 0, 0x2a48d: 5, 0x2a4a1: 2, 0x2a4a4: 0, 0x2a4a5: 3,
+    0x2a4a8: 0, 0x2a4a9: 2, 0x2a4ac: 0, 0x2b023: 2, 0x2b025: 1, 0x2b026: 0,
+    0x2b083: 2, 0x2b085: 1, 0x2b086: 0, 0x2b0a1: 2, 0x2b0a2: 0, 0x2b0a3: 2,
+    0x2b0a4: 0, 0x2b0a5: 1, 0x2b0a6: 0, 0x2c003: 2, 0x2c005: 1, 0x2c006: 0,
+    0x2c009: 2, 0x2c00a: 2, 0x2c00b: 2, 0x2c00c: 7, 0x2c00d: 1, 0x2c00e: 0,
+    0x2c011: 2, 0x2c012: 7, 0x2c013: 2, 0x2c014: 7, 0x2c015: 1, 0x2c016: 0,
+    0x2c018: 2, 0x2c019: 2, 0x2c01a: 7, 0x2c01c: 7, 0x2c081: 2, 0x2c082: 4,
+    0x2c083: 2, 0x2c084: 1, 0x2c085: 1, 0x2c086: 0, 0x2c088: 2, 0x2c089: 2,
+    0x2c08a: 4, 0x2c08c: 1, 0x2c090: 1, 0x2c091: 1, 0x2c094: 1, 0x2c098: 1,
+    0x2c20e: 7, 0x2c216: 7, 0x2c21a: 7, 0x2c21c: 7, 0x2c21e: 7, 0x2c286: 4,
+    0x2c28a: 4, 0x2c28c: 4, 0x2c28e: 4, 0x2c294: 1, 0x2c298: 1, 0x2c29c: 1,
+    0x2c40d: 7, 0x2c415: 7, 0x2c419: 7, 0x2c41c: 7, 0x2c41d: 7, 0x2c485: 3,
+    0x2c489: 2, 0x2c48c: 0, 0x2c48d: 4, 0x2c491: 2, 0x2c494: 3, 0x2c495: 3,
+    0x2c498: 2, 0x2c499: 2, 0x2c49c: 0, 0x2d013: 2, 0x2d015: 1, 0x2d016: 0,
+    0x2d083: 2, 0x2d085: 1, 0x2d086: 0, 0x2d091: 1, 0x2d094: 1, 0x2d095: 1,
+    0x2e00b: 2, 0x2e00d: 1, 0x2e00e: 0, 0x2e083: 2, 0x2e085: 1, 0x2e086: 0,
+    0x2e089: 2, 0x2e08a: 2, 0x2e08b: 2, 0x2e08c: 0, 0x2e08d: 1, 0x2e08e: 0,
+    0x30001: 6, 0x30002: 6, 0x30003: 2, 0x30004: 6, 0x30005: 1, 0x30006: 0,
+    0x30008: 6, 0x30009: 6, 0x3000a: 6, 0x3000c: 6, 0x30010: 6, 0x30011: 6,
+    0x30012: 6, 0x30014: 6, 0x30018: 5, 0x30020: 6, 0x30021: 6, 0x30022: 6,
+    0x30024: 6, 0x30028: 4, 0x30030: 3, 0x30040: 0, 0x30041: 3, 0x30042: 2,
+    0x30044: 4, 0x30048: 0, 0x30050: 2, 0x30060: 4, 0x30206: 6, 0x3020a: 5,
+    0x3020c: 6, 0x3020e: 6, 0x30212: 6, 0x30214: 6, 0x30216: 6, 0x30218: 5,
+    0x3021a: 5, 0x3021c: 6, 0x30222: 3, 0x30224: 6, 0x30226: 4, 0x30228: 4,
+    0x3022a: 4, 0x3022c: 4, 0x30230: 3, 0x30232: 3, 0x30234: 6, 0x30242: 4,
+    0x30244: 4, 0x30246: 4, 0x30248: 4, 0x3024a: 4, 0x3024c: 4, 0x30250: 2,
+    0x30252: 2, 0x30258: 5, 0x30260: 4, 0x30262: 4, 0x30264: 4, 0x30268: 4,
+    0x30270: 2, 0x30405: 6, 0x30409: 6, 0x3040c: 6, 0x3040d: 6, 0x30411: 6,
+    0x30414: 6, 0x30415: 6, 0x30418: 5, 0x30419: 6, 0x3041c: 6, 0x30421: 6,
+    0x30424: 6, 0x30425: 4, 0x30428: 4, 0x30429: 6, 0x3042c: 4, 0x30430: 3,
+    0x30431: 3, 0x30434: 6, 0x30441: 3, 0x30444: 4, 0x30445: 3, 0x30448: 0,
+    0x3044c: 0, 0x30450: 2, 0x30451: 2, 0x30458: 2, 0x30460: 4, 0x30461: 3,
+    0x30464: 4, 0x30468: 0, 0x30470: 2, 0x3061c: 6, 0x3062c: 4, 0x30634: 6,
+    0x3064c: 4, 0x30658: 2, 0x30664: 4, 0x30668: 4, 0x3066c: 4, 0x30670: 2,
+    0x30803: 6, 0x30809: 6, 0x3080a: 6, 0x3080b: 6, 0x30811: 6, 0x30812: 6,
+    0x30813: 6, 0x30818: 5, 0x30819: 6, 0x3081a: 5, 0x30821: 6, 0x30822: 6,
+    0x30823: 6, 0x30828: 4, 0x30829: 6, 0x3082a: 4, 0x30830: 3, 0x30831: 3,
+    0x30832: 3, 0x30841: 3, 0x30842: 5, 0x30843: 3, 0x30848: 0, 0x3084a: 0,
+    0x30850: 5, 0x30851: 3, 0x30852: 5, 0x30858: 0, 0x30860: 3, 0x30861: 3,
+    0x30862: 3, 0x30868: 0, 0x30870: 3, 0x30a1a: 5, 0x30a2a: 4, 0x30a32: 3,
+    0x30a4a: 5, 0x30a52: 5, 0x30a58: 5, 0x30a5a: 5, 0x30a62: 4, 0x30a68: 4,
+    0x30a6a: 4, 0x30a70: 3, 0x30a72: 3, 0x30c19: 6, 0x30c29: 6, 0x30c31: 3,
+    0x30c51: 3, 0x30c58: 0, 0x30c61: 3, 0x30c68: 0, 0x30c70: 3, 0x30c71: 3,
+    0x31003: 2, 0x31005: 1, 0x31006: 0, 0x31011: 6, 0x31012: 6, 0x31013: 2,
+    0x31014: 6, 0x31015: 1, 0x31016: 6, 0x31021: 6, 0x31022: 6, 0x31023: 2,
+    0x31024: 6, 0x31025: 1, 0x31026: 0, 0x31030: 6, 0x31031: 6, 0x31032: 6,
+    0x31034: 6, 0x31041: 2, 0x31042: 2, 0x31043: 2, 0x31044: 4, 0x31045: 1,
+    0x31046: 0, 0x31050: 2, 0x31051: 2, 0x31052: 2, 0x31060: 1, 0x31061: 2,
+    0x31062: 2, 0x31064: 4, 0x31070: 2, 0x31216: 6, 0x31226: 6, 0x31232: 6,
+    0x31234: 6, 0x31236: 6, 0x31246: 4, 0x31252: 2, 0x31262: 4, 0x31264: 4,
+    0x31266: 4, 0x31270: 2, 0x31272: 2, 0x31415: 6, 0x31425: 6, 0x31431: 6,
+    0x31434: 6, 0x31435: 6, 0x31445: 4, 0x31451: 2, 0x31461: 4, 0x31464: 4,
+    0x31465: 4, 0x31470: 2, 0x31471: 2, 0x31813: 5, 0x31823: 6, 0x31831: 6,
+    0x31832: 6, 0x31833: 6, 0x31843: 5, 0x31851: 5, 0x31852: 5, 0x31853: 5,
+    0x31861: 1, 0x31862: 0, 0x31863: 4, 0x31870: 1, 0x31871: 1, 0x31872: 0,
+    0x32003: 2, 0x32005: 1, 0x32006: 0, 0x32009: 6, 0x3200a: 0, 0x3200b: 2,
+    0x3200c: 6, 0x3200d: 6, 0x3200e: 0, 0x32021: 6, 0x32022: 0, 0x32023: 2,
+    0x32024: 6, 0x32025: 1, 0x32026: 0, 0x32028: 0, 0x32029: 6, 0x3202a: 0,
+    0x3202c: 1, 0x32041: 3, 0x32042: 0, 0x32043: 2, 0x32044: 1, 0x32045: 1,
+    0x32046: 0, 0x32048: 0, 0x3204a: 0, 0x3204c: 0, 0x32060: 2, 0x32061: 3,
+    0x32062: 0, 0x32064: 1, 0x32068: 0, 0x3280b: 6, 0x32823: 6, 0x32829: 6,
+    0x3282a: 6, 0x3282b: 6, 0x32843: 3, 0x3284a: 0, 0x32861: 3, 0x32862: 0,
+    0x32863: 3, 0x32868: 0, 0x3286a: 0, 0x33023: 2, 0x33025: 1, 0x33026: 0,
+    0x33043: 2, 0x33045: 1, 0x33046: 0, 0x33061: 1, 0x33062: 0, 0x33063: 2,
+    0x33064: 1, 0x33065: 1, 0x33066: 0, 0x34003: 2, 0x34005: 1, 0x34006: 0,
+    0x34009: 6, 0x3400a: 0, 0x3400b: 2, 0x3400c: 6, 0x3400d: 6, 0x3400e: 0,
+    0x34011: 2, 0x34012: 0, 0x34013: 2, 0x34014: 6, 0x34015: 6, 0x34016: 0,
+    0x34018: 0, 0x34019: 6, 0x3401a: 0, 0x3401c: 6, 0x34041: 3, 0x34042: 2,
+    0x34043: 2, 0x34044: 4, 0x34045: 1, 0x34046: 0, 0x34048: 0, 0x3404a: 0,
+    0x3404c: 0, 0x34050: 2, 0x34051: 2, 0x34052: 2, 0x34058: 0, 0x3420e: 6,
+    0x34216: 6, 0x3421a: 2, 0x3421c: 6, 0x3421e: 6, 0x34246: 4, 0x3424a: 2,
+    0x3424c: 4, 0x3424e: 4, 0x34252: 2, 0x34258: 2, 0x3425a: 2, 0x3440d: 6,
+    0x34415: 6, 0x34419: 6, 0x3441c: 6, 0x3441d: 6, 0x34445: 3, 0x3444c: 0,
+    0x34451: 2, 0x34458: 2, 0x35013: 2, 0x35015: 6, 0x35016: 6, 0x35043: 2,
+    0x35045: 1, 0x35046: 0, 0x35051: 2, 0x35052: 2, 0x35053: 2, 0x3600b: 2,
+    0x3600d: 6, 0x3600e: 0, 0x36043: 2, 0x36045: 1, 0x36046: 0, 0x3604a: 0,
+    0x3604c: 0, 0x3604e: 0,
+}
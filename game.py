@@ -11,8 +11,9 @@ directly (``python game.py``).  The GUI consists of:
 The AI implementation supports three difficulty levels:
 
 * ``Easy`` – chooses a random available move.
-* ``Medium`` – uses a depth-limited minimax search.
-* ``Hard`` – uses a full minimax search to guarantee optimal play.
+* ``Medium`` – uses an iteratively deepened, depth-limited minimax search.
+* ``Hard`` – plays from an opening book precomputed offline with a full
+  alpha-beta minimax search, guaranteeing optimal play.
 
 Both the GUI flow and the decision logic are documented throughout the
 implementation to provide clarity on how user interactions translate
@@ -21,13 +22,14 @@ to updates on the board and how the AI determines its moves.
 
 from __future__ import annotations
 
-import math
 import random
 import sys
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from enum import IntEnum
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import QSignalMapper, QThread, Qt, pyqtSignal
 from PyQt5.QtWidgets import (
     QApplication,
     QComboBox,
@@ -42,13 +44,388 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
+# The eight symmetries of the square (rotations and reflections) expressed as
+# index permutations: the transformed board is ``[board[i] for i in perm]``.
+_SYMMETRIES: Tuple[Tuple[int, ...], ...] = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),  # identity
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),  # rotate 90°
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),  # rotate 180°
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),  # rotate 270°
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),  # mirror left/right
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),  # mirror top/bottom
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),  # main diagonal
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),  # anti-diagonal
+)
+
+# Transposition-table flags describing how a stored score relates to the true
+# minimax value of a position searched with an alpha-beta window.
+_TT_EXACT = 0
+_TT_LOWER = 1
+_TT_UPPER = 2
+
+# Integer stand-in for infinity in alpha-beta windows.  Scores never leave
+# -10..10, so this keeps every comparison on ints instead of mixing floats.
+_INF = 10_000
+
+# Cell indices of the eight winning lines (rows, columns, diagonals).
+_WINNING_LINES = (
+    (0, 1, 2),
+    (3, 4, 5),
+    (6, 7, 8),
+    (0, 3, 6),
+    (1, 4, 7),
+    (2, 5, 8),
+    (0, 4, 8),
+    (2, 4, 6),
+)
+
+# The same lines as bitmasks over the nine cells (bit ``i`` is cell ``i``).
+WIN_MASKS = tuple(sum(1 << index for index in line) for line in _WINNING_LINES)
+_FULL_MASK = 0x1FF
+
+# ``_IS_WIN[mask]`` tells whether a player owning the cells in ``mask`` has
+# completed a line, turning the per-node win test into one tuple index.
+_IS_WIN = tuple(
+    any((mask & w) == w for w in WIN_MASKS) for mask in range(_FULL_MASK + 1)
+)
+
+
+def _permute_mask(mask: int, perm: Tuple[int, ...]) -> int:
+    """Apply a symmetry permutation to a cell bitmask."""
+
+    return sum(1 << index for index, source in enumerate(perm) if mask >> source & 1)
+
+
+# ``_SYMMETRY_MASKS[s][mask]`` is ``mask`` transformed by ``_SYMMETRIES[s]``.
+_SYMMETRY_MASKS = tuple(
+    tuple(_permute_mask(mask, perm) for mask in range(_FULL_MASK + 1))
+    for perm in _SYMMETRIES
+)
+
+
+@lru_cache(maxsize=None)
+def _canonical_masks(x_mask: int, o_mask: int) -> Tuple[int, Tuple[int, ...]]:
+    """Return the canonical key of a position under the square's symmetries.
+
+    The key is the smallest packed ``(x << 9) | o`` value among the eight
+    symmetric variants of the position.  The permutation producing it is
+    returned as well so moves can be translated between the two frames:
+    canonical index ``i`` corresponds to board index ``perm[i]``.
+
+    Only a few thousand positions are reachable, so the results are cached
+    outright and every later search pays a single dict lookup per node.
+    """
+
+    return min(
+        (table[x_mask] << 9 | table[o_mask], perm)
+        for table, perm in zip(_SYMMETRY_MASKS, _SYMMETRIES)
+    )
+
+
+def _completing_move(own_mask: int, other_mask: int) -> Optional[int]:
+    """Return a cell that completes a line for ``own_mask``, if there is one.
 
-@dataclass
+    A line qualifies when the player owns two of its cells and the third
+    is empty.  Called with the roles swapped it finds the cell that blocks
+    the opponent's immediate threat.
+    """
+
+    for w in WIN_MASKS:
+        if (own_mask & w).bit_count() == 2 and not other_mask & w:
+            return (w & ~own_mask).bit_length() - 1
+    return None
+
+
+def _unique_moves(x_mask: int, o_mask: int, free: int, first: int = 0) -> int:
+    """Reduce ``free`` to one representative per class of equivalent moves.
+
+    Moves related by a symmetry that leaves the position unchanged lead to
+    mirror-image games, so only one of each class needs searching.  The
+    ``first`` bit, when free, is kept as the representative of its class.
+    On the empty board this leaves a corner, an edge and the centre.
+    """
+
+    stabilizer = [
+        table
+        for table in _SYMMETRY_MASKS
+        if table[x_mask] == x_mask and table[o_mask] == o_mask
+    ]
+    if len(stabilizer) == 1:
+        return free
+
+    unique = 0
+    bit = first & free or free & -free
+    while free:
+        unique |= bit
+        for table in stabilizer:
+            free &= ~table[bit]
+        bit = free & -free
+    return unique
+
+
+def _minimax_bits(
+    x_mask: int,
+    o_mask: int,
+    is_maximizing: bool,
+    depth_limit: Optional[int],
+    alpha: int,
+    beta: int,
+    tt: dict,
+    move_hint: Optional[int] = None,
+) -> Tuple[int, Optional[int]]:
+    """Alpha-beta minimax over bitboards.
+
+    ``o_mask`` holds the AI's (maximizing) marks and ``x_mask`` the human's.
+    ``depth_limit`` bounds the number of plies searched; ``alpha``/``beta``
+    bound the window within which exact scores are required, and siblings
+    are pruned once ``alpha >= beta``.  ``move_hint`` is searched before the
+    other moves, which tightens the window early when it is a good move.
+
+    Results are memoised in ``tt`` keyed by the canonical form of the
+    position, so positions reached through different move orders (or as
+    mirror images of each other) are only searched once.
+
+    The depth-first search runs on an explicit stack rather than recursing:
+    the node being expanded lives in local variables, and descending into a
+    child saves them as a tuple on ``stack`` until the child is resolved.
+    """
+
+    stack: List[tuple] = []
+    while True:
+        # Enter the position: resolve it from the table or as a terminal
+        # position, or set up the locals needed to expand its moves.
+        depth = len(stack)
+        remaining = None if depth_limit is None else depth_limit - depth
+        canonical, perm = _canonical_masks(x_mask, o_mask)
+        key = (canonical, is_maximizing, remaining)
+        alpha_orig, beta_orig = alpha, beta
+        result: Optional[Tuple[int, Optional[int]]] = None
+
+        entry = tt.get(key)
+        if entry is not None:
+            flag, score, move = entry
+            move = None if move is None else perm[move]
+            if flag == _TT_EXACT:
+                result = score, move
+            elif depth > 0:
+                # Bounds may only narrow the window below the root; the root
+                # needs an exact search to report a trustworthy best move.
+                if flag == _TT_LOWER:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    result = score, move
+
+        if result is None:
+            # Wins are scored by how full the board is rather than by search
+            # depth so that a position's score does not depend on where the
+            # search started; this keeps table entries valid across turns
+            # while still favouring swift wins and slow losses.
+            occupied = x_mask | o_mask
+            if _IS_WIN[o_mask]:
+                result = 10 - occupied.bit_count(), None
+            elif _IS_WIN[x_mask]:
+                result = occupied.bit_count() - 10, None
+            elif occupied == _FULL_MASK or remaining == 0:
+                # Draws and positions at the depth limit are neutral.
+                result = 0, None
+            if result is not None:
+                tt[key] = (_TT_EXACT, result[0], None)
+            else:
+                free = ~occupied & _FULL_MASK
+                first = bit = 0
+                if depth == 0:
+                    first = 0 if move_hint is None else (1 << move_hint) & free
+                    free = _unique_moves(x_mask, o_mask, free, first)
+                best_score = -_INF if is_maximizing else _INF
+                best_move: Optional[int] = None
+                # Only lines through the cell just played can become
+                # complete, so a winning move is detected with one lookup on
+                # the mover's mask and scored without entering the child.
+                win_score = 9 - occupied.bit_count()
+
+        # Feed results back up the stack and advance through moves until a
+        # child needs entering or the root has been resolved.
+        while True:
+            if result is not None:
+                if not stack:
+                    return result
+                score = result[0]
+                result = None
+                (
+                    x_mask,
+                    o_mask,
+                    is_maximizing,
+                    alpha,
+                    beta,
+                    alpha_orig,
+                    beta_orig,
+                    key,
+                    perm,
+                    free,
+                    first,
+                    bit,
+                    best_score,
+                    best_move,
+                    win_score,
+                ) = stack.pop()
+            elif free:
+                bit = first & free or free & -free
+                free ^= bit
+                child_x, child_o = (
+                    (x_mask, o_mask | bit) if is_maximizing else (x_mask | bit, o_mask)
+                )
+                if _IS_WIN[child_o]:
+                    score = win_score
+                elif _IS_WIN[child_x]:
+                    score = -win_score
+                else:
+                    stack.append(
+                        (
+                            x_mask,
+                            o_mask,
+                            is_maximizing,
+                            alpha,
+                            beta,
+                            alpha_orig,
+                            beta_orig,
+                            key,
+                            perm,
+                            free,
+                            first,
+                            bit,
+                            best_score,
+                            best_move,
+                            win_score,
+                        )
+                    )
+                    x_mask, o_mask = child_x, child_o
+                    is_maximizing = not is_maximizing
+                    break
+            else:
+                # Every move has been searched (or the rest were pruned).
+                if best_score <= alpha_orig:
+                    flag = _TT_UPPER
+                elif best_score >= beta_orig:
+                    flag = _TT_LOWER
+                else:
+                    flag = _TT_EXACT
+                stored_move = None if best_move is None else perm.index(best_move)
+                tt[key] = (flag, best_score, stored_move)
+                result = best_score, best_move
+                continue
+
+            # Account for the score of the move ``bit``.
+            if is_maximizing:
+                if score > best_score:
+                    best_score, best_move = score, bit.bit_length() - 1
+                alpha = max(alpha, best_score)
+            else:
+                if score < best_score:
+                    best_score, best_move = score, bit.bit_length() - 1
+                beta = min(beta, best_score)
+            if alpha >= beta:
+                free = 0
+
+
+def _build_hard_policy() -> Dict[int, int]:
+    """Compute the optimal AI move for every reachable undecided position.
+
+    The positions are enumerated with a depth-first walk from the empty
+    board (allowing either player to start) and each position in which the
+    AI may be on move is solved with :func:`_minimax_bits`.  The returned
+    mapping is keyed by the packed position ``(x_mask << 9) | o_mask``.
+
+    ``tools/gen_book.py`` runs this offline to generate the
+    :data:`_opening_book.HARD_BOOK` table used at runtime.
+    """
+
+    tt: dict = {}
+    policy: Dict[int, int] = {}
+    seen = set()
+    stack = [(0, 0)]
+    while stack:
+        x_mask, o_mask = position = stack.pop()
+        if position in seen:
+            continue
+        seen.add(position)
+
+        occupied = x_mask | o_mask
+        if occupied == _FULL_MASK or _IS_WIN[x_mask] or _IS_WIN[o_mask]:
+            continue
+
+        x_count, o_count = x_mask.bit_count(), o_mask.bit_count()
+        if x_count >= o_count:
+            _, move = _minimax_bits(x_mask, o_mask, True, None, -_INF, _INF, tt)
+            policy[x_mask << 9 | o_mask] = move
+
+        free = ~occupied & _FULL_MASK
+        while free:
+            bit = free & -free
+            free ^= bit
+            if x_count <= o_count:
+                stack.append((x_mask | bit, o_mask))
+            if x_count >= o_count:
+                stack.append((x_mask, o_mask | bit))
+    return policy
+
+
+class Mode(IntEnum):
+    """Who the human plays against."""
+
+    PVP = 0
+    AI = 1
+
+
+class Difficulty(IntEnum):
+    """Strength of the AI opponent."""
+
+    EASY = 0
+    MEDIUM = 1
+    HARD = 2
+
+    @property
+    def label(self) -> str:
+        """Name shown in the difficulty selector, e.g. ``"Medium"``."""
+
+        return self.name.title()
+
+
+@dataclass(slots=True)
 class GameConfig:
     """Container for configuration that influences AI behaviour."""
 
-    mode: str = "ai"  # Either "pvp" or "ai".
-    difficulty: str = "Medium"  # Easy, Medium, Hard.
+    mode: Mode = Mode.AI
+    difficulty: Difficulty = Difficulty.MEDIUM
+
+
+class AIWorker(QThread):
+    """Background thread that picks the AI move for a snapshot of the board.
+
+    Running the search off the GUI thread keeps the window responsive (and
+    lets the "AI is thinking..." status actually paint) while the AI decides.
+    The chosen move is delivered back to the GUI thread via :attr:`move_ready`.
+    """
+
+    move_ready = pyqtSignal(int)
+
+    def __init__(
+        self,
+        board: List[Optional[str]],
+        difficulty: Difficulty,
+        tt: dict,
+        parent: Optional[QWidget] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._board = list(board)
+        self._difficulty = difficulty
+        self._tt = tt
+
+    def run(self) -> None:
+        move = TicTacToeGame._choose_ai_move(self._board, self._difficulty, self._tt)
+        if move is not None:
+            self.move_ready.emit(move)
 
 
 class TicTacToeGame(QMainWindow):
@@ -66,11 +443,17 @@ class TicTacToeGame(QMainWindow):
         self.current_player: str = self.HUMAN_MARK
         self.game_over: bool = False
         self.config = GameConfig()
+        # Transposition table shared by minimax searches within one game.
+        self._tt: dict = {}
+        # Worker computing the pending AI move, if any.
+        self._ai_worker: Optional[AIWorker] = None
 
         # Widgets stored for later updates.
         self.buttons: List[QPushButton] = []
+        # Enabling/disabling this container toggles every cell in one call.
+        self._board_group = QGroupBox("Board")
         self.status_label = QLabel()
-        self.mode_buttons: dict[str, QPushButton] = {}
+        self.mode_buttons: dict[Mode, QPushButton] = {}
         self.difficulty_combo = QComboBox()
 
         self._build_ui()
@@ -99,7 +482,7 @@ class TicTacToeGame(QMainWindow):
 
         # Mode selection buttons make it explicit which mode is active.
         mode_layout = QHBoxLayout()
-        for mode_key, label in (("pvp", "Player vs Player"), ("ai", "Player vs AI")):
+        for mode_key, label in ((Mode.PVP, "Player vs Player"), (Mode.AI, "Player vs AI")):
             button = QPushButton(label)
             button.setCheckable(True)
             button.clicked.connect(lambda checked, m=mode_key: self.set_mode(m))
@@ -110,7 +493,7 @@ class TicTacToeGame(QMainWindow):
         # Difficulty options control the intelligence of the AI opponent.
         difficulty_layout = QHBoxLayout()
         difficulty_layout.addWidget(QLabel("AI Difficulty:"))
-        self.difficulty_combo.addItems(["Easy", "Medium", "Hard"])
+        self.difficulty_combo.addItems([level.label for level in Difficulty])
         self.difficulty_combo.currentTextChanged.connect(self.set_difficulty)
         difficulty_layout.addWidget(self.difficulty_combo)
 
@@ -122,15 +505,18 @@ class TicTacToeGame(QMainWindow):
 
         # Initialise the UI to reflect the default configuration.
         self._update_mode_buttons()
-        self.difficulty_combo.setCurrentText(self.config.difficulty)
+        self.difficulty_combo.setCurrentText(self.config.difficulty.label)
 
         return controls
 
     def _build_board(self) -> QWidget:
         """Create the 3×3 grid of buttons representing the board."""
 
-        board_widget = QGroupBox("Board")
-        grid_layout = QGridLayout(board_widget)
+        grid_layout = QGridLayout(self._board_group)
+        # A single mapper turns any button's click into its cell index, so
+        # every cell shares one handle_move connection.
+        cell_mapper = QSignalMapper(self)
+        cell_mapper.mappedInt.connect(self.handle_move)
 
         for index in range(9):
             button = QPushButton(" ")
@@ -138,12 +524,13 @@ class TicTacToeGame(QMainWindow):
             font = button.font()
             font.setPointSize(24)
             button.setFont(font)
-            button.clicked.connect(lambda _checked, idx=index: self.handle_move(idx))
+            button.clicked.connect(cell_mapper.map)
+            cell_mapper.setMapping(button, index)
             row, col = divmod(index, 3)
             grid_layout.addWidget(button, row, col)
             self.buttons.append(button)
 
-        return board_widget
+        return self._board_group
 
     def _build_status_bar(self) -> QWidget:
         """Create the status display shown below the board."""
@@ -157,28 +544,32 @@ class TicTacToeGame(QMainWindow):
     # ------------------------------------------------------------------
     # Event handlers and UI updates
     # ------------------------------------------------------------------
-    def set_mode(self, mode: str) -> None:
+    def set_mode(self, mode: Mode) -> None:
         """Update the game mode and reset the board if necessary."""
 
-        if mode not in {"pvp", "ai"}:
+        try:
+            mode = Mode(mode)
+        except ValueError:
             return
-        if self.config.mode != mode:
+        if self.config.mode is not mode:
             self.config.mode = mode
             self.reset_board()
         self._update_mode_buttons()
 
     def set_difficulty(self, difficulty: str) -> None:
-        """Update the AI difficulty level."""
+        """Update the AI difficulty level from its label (e.g. ``"Hard"``)."""
 
-        if difficulty not in {"Easy", "Medium", "Hard"}:
+        try:
+            level = Difficulty[difficulty.upper()]
+        except KeyError:
             return
-        self.config.difficulty = difficulty
+        self.config.difficulty = level
         # Resetting gives the AI a fresh game whenever difficulty changes.
         self.reset_board()
 
     def _update_mode_buttons(self) -> None:
         for mode, button in self.mode_buttons.items():
-            button.setChecked(mode == self.config.mode)
+            button.setChecked(mode is self.config.mode)
 
     def _update_status(self, message: Optional[str] = None) -> None:
         """Refresh the status label with contextual information."""
@@ -194,7 +585,7 @@ class TicTacToeGame(QMainWindow):
             else:
                 self.status_label.setText(f"{winner} wins!")
         else:
-            if self.config.mode == "ai" and self.current_player == self.AI_MARK:
+            if self.config.mode is Mode.AI and self.current_player == self.AI_MARK:
                 self.status_label.setText("AI is thinking...")
             else:
                 self.status_label.setText(f"{self.current_player}'s turn")
@@ -205,13 +596,17 @@ class TicTacToeGame(QMainWindow):
         self.board = [None] * 9
         self.current_player = self.HUMAN_MARK
         self.game_over = False
+        self._tt = {}
+        # Any move still being computed belongs to the previous game.
+        self._ai_worker = None
+        self._board_group.setEnabled(True)
         for button in self.buttons:
             button.setText(" ")
             button.setEnabled(True)
         self._update_status()
 
         # If AI mode starts with the AI, let it play immediately.
-        if self.config.mode == "ai" and self.current_player == self.AI_MARK:
+        if self.config.mode is Mode.AI and self.current_player == self.AI_MARK:
             self._trigger_ai_turn()
 
     def handle_move(self, index: int) -> None:
@@ -232,17 +627,30 @@ class TicTacToeGame(QMainWindow):
         self.current_player = self.AI_MARK if self.current_player == self.HUMAN_MARK else self.HUMAN_MARK
         self._update_status()
 
-        if self.config.mode == "ai" and self.current_player == self.AI_MARK:
+        if self.config.mode is Mode.AI and self.current_player == self.AI_MARK:
             self._trigger_ai_turn()
 
     def _trigger_ai_turn(self) -> None:
-        """Perform an AI move according to the configured difficulty."""
+        """Start computing an AI move according to the configured difficulty."""
+
+        # The board stays locked until the worker reports back so the human
+        # cannot play out of turn while the AI is thinking.
+        self._board_group.setEnabled(False)
+
+        worker = AIWorker(self.board, self.config.difficulty, self._tt, self)
+        worker.move_ready.connect(self._on_ai_move_ready)
+        worker.finished.connect(worker.deleteLater)
+        self._ai_worker = worker
+        worker.start()
 
-        QApplication.processEvents()
+    def _on_ai_move_ready(self, move: int) -> None:
+        """Play the move reported by the AI worker."""
 
-        move = self._choose_ai_move()
-        if move is None:
+        if self.sender() is not self._ai_worker:
+            # Result of a search started before the board was reset.
             return
+        self._ai_worker = None
+        self._board_group.setEnabled(True)
         self.handle_move(move)
 
     # ------------------------------------------------------------------
@@ -256,20 +664,14 @@ class TicTacToeGame(QMainWindow):
     def check_winner(board: List[Optional[str]]) -> Optional[str]:
         """Return the winner ("X"/"O"), "Draw" or ``None`` if undecided."""
 
-        winning_lines = [
-            (0, 1, 2),
-            (3, 4, 5),
-            (6, 7, 8),
-            (0, 3, 6),
-            (1, 4, 7),
-            (2, 5, 8),
-            (0, 4, 8),
-            (2, 4, 6),
-        ]
-        for a, b, c in winning_lines:
-            if board[a] and board[a] == board[b] == board[c]:
-                return board[a]
-        if all(value is not None for value in board):
+        # All eight lines are tested at once through the win lookup table,
+        # the same check the AI search performs on its bitboards.
+        x_mask, o_mask = TicTacToeGame._board_masks(board)
+        if _IS_WIN[x_mask]:
+            return TicTacToeGame.HUMAN_MARK
+        if _IS_WIN[o_mask]:
+            return TicTacToeGame.AI_MARK
+        if x_mask | o_mask == _FULL_MASK:
             return "Draw"
         return None
 
@@ -279,8 +681,7 @@ class TicTacToeGame(QMainWindow):
         result = self.check_winner(self.board)
         if result:
             self.game_over = True
-            for button in self.buttons:
-                button.setEnabled(False)
+            self._board_group.setEnabled(False)
             self._update_status()
             # Provide a modal prompt so the user can immediately restart.
             QMessageBox.information(self, "Game Over", self.status_label.text())
@@ -290,45 +691,93 @@ class TicTacToeGame(QMainWindow):
     # ------------------------------------------------------------------
     # AI logic
     # ------------------------------------------------------------------
-    def _choose_ai_move(self) -> Optional[int]:
-        """Dispatch to the AI strategy configured for the current difficulty."""
+    @staticmethod
+    def _choose_ai_move(
+        board: List[Optional[str]], difficulty: Difficulty, tt: dict
+    ) -> Optional[int]:
+        """Dispatch to the AI strategy configured for ``difficulty``.
+
+        This only reads its arguments, so it is safe to call from
+        :class:`AIWorker` with a snapshot of the board.
+        """
 
-        available = self.available_moves(self.board)
-        if not available:
+        # Only Easy needs the list of free cells; the searches walk the
+        # free cells of their bitboards directly.
+        if None not in board:
             return None
 
-        if self.config.difficulty == "Easy":
-            return random.choice(available)
+        if difficulty is Difficulty.EASY:
+            return random.choice(TicTacToeGame.available_moves(board))
+
+        if difficulty is Difficulty.MEDIUM:
+            # Winning on the spot, or else blocking the human's open line, is
+            # the only sensible reply in such positions and needs no search.
+            # (Hard does not bother: its book lookup is already cheaper.)
+            x_mask, o_mask = TicTacToeGame._board_masks(board)
+            move = _completing_move(o_mask, x_mask)
+            if move is None:
+                move = _completing_move(x_mask, o_mask)
+            if move is not None:
+                return move
+
+            # Iterative deepening: each shallower search's best move is tried
+            # first at the next depth so alpha-beta can prune more of it.
+            move = None
+            for depth_limit in range(1, 4):
+                _, move = TicTacToeGame._minimax(
+                    board,
+                    tt,
+                    is_maximizing=True,
+                    depth_limit=depth_limit,
+                    move_hint=move,
+                )
+            return move
+
+        # Hard difficulty plays from the opening book generated offline by
+        # tools/gen_book.py, so no search runs while the player waits.  The
+        # book is imported here so the generator can import this module
+        # before the book exists.
+        from _opening_book import HARD_BOOK
+
+        x_mask, o_mask = TicTacToeGame._board_masks(board)
+        return HARD_BOOK[x_mask << 9 | o_mask]
 
-        if self.config.difficulty == "Medium":
-            _, move = self._minimax(self.board, is_maximizing=True, depth_limit=3)
-            return move if move is not None else random.choice(available)
+    @staticmethod
+    def _board_masks(board: List[Optional[str]]) -> Tuple[int, int]:
+        """Encode ``board`` as ``(x_mask, o_mask)`` bitboards (bit ``i`` = cell ``i``)."""
 
-        # Hard difficulty defaults to a full minimax search.
-        _, move = self._minimax(self.board, is_maximizing=True, depth_limit=None)
-        return move if move is not None else random.choice(available)
+        x_mask = o_mask = 0
+        for index, value in enumerate(board):
+            if value == TicTacToeGame.HUMAN_MARK:
+                x_mask |= 1 << index
+            elif value == TicTacToeGame.AI_MARK:
+                o_mask |= 1 << index
+        return x_mask, o_mask
 
+    @staticmethod
     def _minimax(
-        self,
         board: List[Optional[str]],
+        tt: dict,
         *,
         is_maximizing: bool,
         depth_limit: Optional[int],
-        depth: int = 0,
-    ) -> Tuple[float, Optional[int]]:
-        """Perform a minimax search.
+        move_hint: Optional[int] = None,
+    ) -> Tuple[int, Optional[int]]:
+        """Perform a minimax search with alpha-beta pruning.
 
         Parameters
         ----------
         board:
             Snapshot of the board for which the optimal move is sought.
+        tt:
+            Transposition table shared between searches of the same game.
         is_maximizing:
             ``True`` when it is the AI's turn; ``False`` for the human.
         depth_limit:
             Maximum depth explored (``None`` for unlimited).
-        depth:
-            Current recursion depth used for limit enforcement and for
-            slight score adjustments that favour quicker victories.
+        move_hint:
+            Move to search first, typically the best move of a shallower
+            search of the same board.
 
         Returns
         -------
@@ -336,48 +785,22 @@ class TicTacToeGame(QMainWindow):
             ``(score, move)`` representing the outcome value and the index of
             the best move.  Scores are positive for AI-favourable states and
             negative for human-favourable states.
-        """
 
-        result = self.check_winner(board)
-        if result == self.AI_MARK:
-            return 10 - depth, None
-        if result == self.HUMAN_MARK:
-            return depth - 10, None
-        if result == "Draw":
-            return 0, None
-
-        if depth_limit is not None and depth >= depth_limit:
-            # At the depth limit, evaluate the board heuristically.  Here we
-            # simply return neutral (0), but the depth-based adjustments above
-            # already provide a bias toward swift wins and slow losses.
-            return 0, None
-
-        best_move: Optional[int] = None
-        if is_maximizing:
-            best_score = -math.inf
-            mark = self.AI_MARK
-        else:
-            best_score = math.inf
-            mark = self.HUMAN_MARK
-
-        for move in self.available_moves(board):
-            board[move] = mark
-            score, _ = self._minimax(
-                board,
-                is_maximizing=not is_maximizing,
-                depth_limit=depth_limit,
-                depth=depth + 1,
-            )
-            board[move] = None
-
-            if is_maximizing:
-                if score > best_score:
-                    best_score, best_move = score, move
-            else:
-                if score < best_score:
-                    best_score, best_move = score, move
+        The board is converted to bitboards once and the search itself runs
+        in :func:`_minimax_bits`.
+        """
 
-        return best_score, best_move
+        x_mask, o_mask = TicTacToeGame._board_masks(board)
+        return _minimax_bits(
+            x_mask,
+            o_mask,
+            is_maximizing,
+            depth_limit,
+            -_INF,
+            _INF,
+            tt,
+            move_hint,
+        )
 
 
 def main() -> int:
@@ -0,0 +1,53 @@
+"""Generate ``_opening_book.py``, the move table used by the Hard AI.
+
+The script solves every reachable position with the alpha-beta search from
+:mod:`game` and writes the optimal AI move for each one as a Python module
+next to ``game.py``.  Re-run it whenever the search or its scoring changes::
+
+    python tools/gen_book.py
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import game  # noqa: E402  (needs the repository root on sys.path)
+
+BOOK_PATH = ROOT / "_opening_book.py"
+ENTRIES_PER_LINE = 6
+
+HEADER = '''"""Optimal Hard-difficulty moves for every reachable Tic-Tac-Toe position.
+
+Generated by ``tools/gen_book.py`` -- do not edit by hand.
+
+``HARD_BOOK`` maps a packed position ``(x_mask << 9) | o_mask`` (bit ``i`` of
+each mask is cell ``i``) to the index of the AI's best move.
+"""
+
+'''
+
+
+def render(book: dict[int, int]) -> str:
+    """Return the source of the opening-book module for ``book``."""
+
+    entries = [f"0x{key:05x}: {move}," for key, move in sorted(book.items())]
+    lines = ["HARD_BOOK = {"]
+    for start in range(0, len(entries), ENTRIES_PER_LINE):
+        lines.append("    " + " ".join(entries[start : start + ENTRIES_PER_LINE]))
+    lines.append("}")
+    return HEADER + "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    book = game._build_hard_policy()
+    BOOK_PATH.write_text(render(book), encoding="utf-8")
+    print(f"Wrote {len(book)} positions to {BOOK_PATH.relative_to(ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())